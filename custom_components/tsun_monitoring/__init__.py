@@ -1,49 +1,247 @@
 """The TSUN Monitoring integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Callable, Collection
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 import logging
-from datetime import timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import SUN_EVENT_SUNRISE, Platform
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.sun import get_astral_event_next, is_up
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
-from .api import TsunMonitoringAPI
+from .const import (
+    API_BASE_URL,
+    CONF_DAY_GRAPH_STATISTICS,
+    CONF_DISABLED_SECTIONS,
+    CONF_DYNAMIC_SENSORS,
+    CONF_LIVE_INTERVAL,
+    CONF_MAX_CONCURRENCY,
+    CONF_STATION_CONCURRENCY,
+    DAILY_SECTIONS,
+    DEFAULT_LIVE_INTERVAL,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_STATION_CONCURRENCY,
+    DOMAIN,
+    REFRESH_STAGGER,
+    SECTION_ALERTS,
+    SECTION_HISTORY_DAY,
+    SECTION_KEYS,
+    SECTION_REFRESH_INTERVALS,
+    STATION_DETAIL_SECTIONS,
+    STATION_SECTIONS,
+    LIVE_UPDATE_INTERVAL,
+    UPDATE_INTERVAL,
+)
+from .api import TsunMonitoringAsyncAPI
+from .backfill import async_get_backfill, async_register_backfill_service
+from .entity_ids import dynamic_sensor_key
+from .limits import async_get_rate_limiter
+from .metrics import RefreshProfile
+from .polling import AdaptivePollingPolicy, RefreshStagger
+from .series import PowerSeries
+from .statistics import DayCurveStatisticsImporter
+from .storage import SNAPSHOT_SAVE_DELAY, SnapshotStore, async_get_token_store
+from .websocket_api import async_register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+DATA_REFRESH_STAGGER = f"{DOMAIN}_refresh_stagger"
+
+
+@dataclass
+class TsunMonitoringData:
+    """Coordinators of a config entry, stored in ``hass.data``."""
+
+    coordinator: TsunMonitoringCoordinator
+    live_coordinator: TsunMonitoringLiveCoordinator | None = None
+
+
+@singleton(DATA_REFRESH_STAGGER)
+@callback
+def _async_get_refresh_stagger(hass: HomeAssistant) -> RefreshStagger:
+    """Return the refresh offsets shared by every entry."""
+    return RefreshStagger(REFRESH_STAGGER, UPDATE_INTERVAL)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the websocket API and services of the integration."""
+    async_register_websocket_commands(hass)
+    async_register_backfill_service(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up TSUN Monitoring from a config entry."""
-    api = TsunMonitoringAPI(
+    # Every entry goes through Home Assistant's shared connection pool and the
+    # rate limiter of the API host, so several accounts cannot add up to a
+    # burst of requests.
+    api = TsunMonitoringAsyncAPI(
+        session=async_get_clientsession(hass),
         username=entry.data["username"],
         password=entry.data["password"],
+        max_concurrency=entry.options.get(
+            CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY
+        ),
+        station_concurrency=entry.options.get(
+            CONF_STATION_CONCURRENCY, DEFAULT_STATION_CONCURRENCY
+        ),
+        rate_limiter=async_get_rate_limiter(hass, API_BASE_URL),
+        disabled_sections=entry.options.get(CONF_DISABLED_SECTIONS, []),
+        # Only the statistics importer consumes the previous day's points.
+        complete_previous_day=entry.options.get(CONF_DAY_GRAPH_STATISTICS, False),
+        now=dt_util.now,
+    )
+
+    # Reuse the tokens of the last session (or of the config flow check) so a
+    # restart does not need a password login before the first refresh.
+    token_store = await async_get_token_store(hass)
+    if tokens := token_store.async_get(api.username):
+        api.restore_tokens(tokens)
+    api.token_update_callback = lambda tokens: token_store.async_set(
+        api.username, tokens
     )
 
     try:
-        await hass.async_add_executor_job(api.authenticate)
+        await api.ensure_authenticated()
     except Exception as err:
         raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
 
-    coordinator = TsunMonitoringCoordinator(hass, api)
-    await coordinator.async_config_entry_first_refresh()
+    stagger = _async_get_refresh_stagger(hass)
+    refresh_offset = stagger.acquire(entry.entry_id)
+    entry.async_on_unload(lambda: stagger.release(entry.entry_id))
+
+    snapshot_store = SnapshotStore(hass, entry.entry_id)
+    coordinator = TsunMonitoringCoordinator(hass, api, snapshot_store)
+    entry.async_on_unload(coordinator.async_shutdown)
+    if snapshot := await snapshot_store.async_load():
+        # Warm start: create the entities from the last saved payload and let
+        # the live refresh replace it in the background.
+        coordinator.async_restore(*snapshot)
+    else:
+        # The first refresh cannot wait: only the following ones are offset.
+        coordinator.refresh_offset = refresh_offset
+        await coordinator.async_config_entry_first_refresh()
+
+    live_coordinator = None
+    if live_interval := int(
+        entry.options.get(CONF_LIVE_INTERVAL, DEFAULT_LIVE_INTERVAL)
+    ):
+        live_coordinator = TsunMonitoringLiveCoordinator(
+            hass, coordinator, timedelta(seconds=live_interval)
+        )
 
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    hass.data[DOMAIN][entry.entry_id] = TsunMonitoringData(
+        coordinator, live_coordinator
+    )
+
+    if entry.options.get(CONF_DAY_GRAPH_STATISTICS, False):
+        importer = DayCurveStatisticsImporter(hass)
+
+        @callback
+        def _async_import_statistics() -> None:
+            """Import the day curves of the latest coordinator data."""
+            if (
+                coordinator.last_update_success
+                and coordinator.data
+                and not coordinator.restored
+            ):
+                importer.async_import_items(coordinator.data)
+
+        _async_import_statistics()
+        entry.async_on_unload(coordinator.async_add_listener(_async_import_statistics))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    # History backfills interrupted by a restart or reload carry on.
+    backfill = await async_get_backfill(hass)
+    backfill.async_resume(
+        entry,
+        api,
+        {
+            station_id: station.data["station"].get("name", str(station_id))
+            for station_id, station in coordinator.stations.items()
+        },
+    )
+
+    if coordinator.restored:
+
+        async def _async_warm_start_refresh() -> None:
+            """Refresh the restored data at the offset of the entry."""
+            await asyncio.sleep(refresh_offset.total_seconds())
+            await coordinator.async_refresh()
+
+        entry.async_create_background_task(
+            hass, _async_warm_start_refresh(), f"{DOMAIN} warm start refresh"
+        )
+        if live_coordinator is not None:
+            # The station list alone answers faster than the full refresh.
+            entry.async_create_background_task(
+                hass, live_coordinator.async_refresh(), f"{DOMAIN} live refresh"
+            )
+
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate a config entry from an older version.
+
+    Version 2 creates dynamic sensors disabled unless allowlisted; the
+    dynamic sensors registered before are disabled the same way, except the
+    ones already disabled by hand.
+    """
+    if entry.version == 1:
+        allowed = set(entry.options.get(CONF_DYNAMIC_SENSORS, []))
+        registry = er.async_get(hass)
+        for entity_entry in er.async_entries_for_config_entry(
+            registry, entry.entry_id
+        ):
+            key = dynamic_sensor_key(entity_entry.unique_id)
+            if key is None or key in allowed or entity_entry.disabled_by:
+                continue
+            registry.async_update_entity(
+                entity_entry.entity_id,
+                disabled_by=er.RegistryEntryDisabler.INTEGRATION,
+            )
+        hass.config_entries.async_update_entry(entry, version=2)
+        _LOGGER.debug("Migrated config entry %s to version 2", entry.entry_id)
+
+    return True
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the stored tokens and snapshot of a removed config entry."""
+    token_store = await async_get_token_store(hass)
+    token_store.async_remove(entry.data["username"])
+    await SnapshotStore(hass, entry.entry_id).async_remove()
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
@@ -52,22 +250,494 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return unload_ok
 
 
+def _sun_state(hass: HomeAssistant) -> tuple[bool, timedelta | None]:
+    """Return whether the sun is up and, at night, the time until sunrise."""
+    if is_up(hass):
+        return True, None
+    return False, get_astral_event_next(hass, SUN_EVENT_SUNRISE) - dt_util.utcnow()
+
+
+@dataclass
+class CachedSection:
+    """Last fetched values of one station section."""
+
+    values: dict[str, Any]
+    fetched_at: datetime
+    day: date
+
+
 class TsunMonitoringCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching TSUN Monitoring data."""
+    """Station list coordinator of an account.
+
+    Each update fetches the status count, the station list and the alerts of
+    every station in one bulk request, then hands them to the
+    ``TsunMonitoringStationCoordinator`` of each station, which fetches the
+    other detail sections on its own schedule. A station coordinator is
+    created when a station appears, refreshed once within the update (or in
+    the background after the first update), and shut down when its station
+    leaves the account. ``data`` lists the items of every station coordinator.
+
+    The update interval is adapted after each update by
+    ``AdaptivePollingPolicy``, from the sun position and live station power.
+    A ``refresh_offset`` set before the first refresh is added once to the
+    following interval, to stagger the entries of several accounts. Station
+    coordinators created meanwhile get the same offset.
 
-    def __init__(self, hass: HomeAssistant, api: TsunMonitoringAPI) -> None:
+    The payload is saved to a snapshot shortly after any coordinator updated
+    it; after a restart the snapshot is served, flagged as restored, until
+    the first live refresh.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: TsunMonitoringAsyncAPI,
+        snapshot_store: SnapshotStore | None = None,
+    ) -> None:
         """Initialize."""
         self.api = api
+        self.restored_at: datetime | None = None
+        self.stations: dict[int, TsunMonitoringStationCoordinator] = {}
+        self._station_unsubs: dict[int, Callable[[], None]] = {}
+        self._snapshot_store = snapshot_store
+        self._snapshot_pending = False
+        self._polling_policy = AdaptivePollingPolicy()
+        self.last_refresh: RefreshProfile | None = None
+        self.refresh_offset = timedelta(0)
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=5),
+            update_interval=UPDATE_INTERVAL,
+        )
+
+    @property
+    def restored(self) -> bool:
+        """Return True while the data comes from the on-disk snapshot."""
+        return self.restored_at is not None
+
+    @callback
+    def async_restore(self, data: list[dict[str, Any]], saved_at: datetime) -> None:
+        """Serve a saved payload until the first live refresh.
+
+        Station coordinators are created from their snapshot item, so their
+        first refresh only fetches the sections that were already due.
+        """
+        for item in data:
+            station_id = item.get("station", {}).get("id")
+            if station_id and station_id not in self.stations:
+                self._async_add_station(station_id, item).async_restore(saved_at)
+
+        self.data = [station.data for station in self.stations.values()]
+        self.restored_at = saved_at
+
+    @callback
+    def _async_add_station(
+        self, station_id: int, item: dict[str, Any]
+    ) -> TsunMonitoringStationCoordinator:
+        """Create the coordinator of a station."""
+        station = self.stations[station_id] = TsunMonitoringStationCoordinator(
+            self.hass, self, station_id, item
         )
+        station.refresh_offset = self.refresh_offset
+        # Listening also keeps the station refreshing when it has no entity.
+        self._station_unsubs[station_id] = station.async_add_listener(
+            self._async_schedule_snapshot
+        )
+        return station
+
+    async def _async_remove_station(self, station_id: int) -> None:
+        """Shut down the coordinator of a station that left the account."""
+        self._station_unsubs.pop(station_id)()
+        await self.stations.pop(station_id).async_shutdown()
+
+    async def async_shutdown(self) -> None:
+        """Cancel the refreshes of every station coordinator and of this one."""
+        for station_id in list(self.stations):
+            await self._async_remove_station(station_id)
+        await super().async_shutdown()
+
+    @callback
+    def _async_schedule_snapshot(self) -> None:
+        """Save the data shortly, in one save for updates close together."""
+        if self._snapshot_store is None or self._snapshot_pending:
+            return
+        self._snapshot_pending = True
+
+        async def _async_save() -> None:
+            try:
+                await asyncio.sleep(SNAPSHOT_SAVE_DELAY)
+                if self.data:
+                    await self._snapshot_store.async_save(self.data)
+            finally:
+                self._snapshot_pending = False
+
+        self.hass.async_create_background_task(_async_save(), f"{DOMAIN} snapshot")
+
+    def _adapt_update_interval(self, stations: list[dict[str, Any]]) -> None:
+        """Pick the interval until the next update from the latest data."""
+        sun_up, until_sunrise = _sun_state(self.hass)
+        interval = self._polling_policy.next_interval(
+            (item.get("station", {}) for item in stations), sun_up, until_sunrise
+        )
+        if self.refresh_offset:
+            interval += self.refresh_offset
+            self.refresh_offset = timedelta(0)
+        if interval != self.update_interval:
+            _LOGGER.debug("Update interval set to %s", interval)
+            self.update_interval = interval
+
+    def get_station_item(self, station_id: int) -> dict[str, Any] | None:
+        """Return the item of a station from the current data."""
+        station = self.stations.get(station_id)
+        return None if station is None else station.data
+
+    async def _async_update_stations(self, stations: list[dict[str, Any]]) -> None:
+        """Apply a station list to the station coordinators.
+
+        Coordinators of new stations, and of stations still served from the
+        snapshot, are refreshed: within the first update, so the entities
+        start with every section, and in the background afterwards.
+        """
+        now = dt_util.utcnow()
+        seen: set[int] = set()
+        pending: list[TsunMonitoringStationCoordinator] = []
+        for item in stations:
+            station_id = item.get("station", {}).get("id")
+            if not station_id:
+                continue
+            seen.add(station_id)
+            if (station := self.stations.get(station_id)) is None:
+                station = self._async_add_station(station_id, {})
+                pending.append(station)
+            elif station.restored:
+                pending.append(station)
+            station.async_set_station(item, now)
+
+        for station_id in set(self.stations) - seen:
+            await self._async_remove_station(station_id)
+
+        for station in self.stations.values():
+            if station not in pending:
+                station.async_update_listeners()
+
+        if self.data is None:
+            await asyncio.gather(*(station.async_refresh() for station in pending))
+            return
+        for station in pending:
+            self.hass.async_create_background_task(
+                station.async_refresh(), f"{DOMAIN} station {station.station_id}"
+            )
 
     async def _async_update_data(self):
         """Update data via library."""
+        profile = RefreshProfile()
+        try:
+            with profile.activate():
+                # Alerts are the only section fetched here, in bulk.
+                stations = await self.api.get_stations(
+                    lambda station: (SECTION_ALERTS,), profile
+                )
+        except Exception as err:
+            profile.finish()
+            self.last_refresh = profile
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+        # Station refreshes count their requests in their own profile.
+        with profile.phase("station_coordinators"):
+            await self._async_update_stations(stations)
+        self.restored_at = None
+        self._adapt_update_interval(stations)
+        profile.finish()
+        self.last_refresh = profile
+        return [station.data for station in self.stations.values()]
+
+
+class TsunMonitoringStationCoordinator(DataUpdateCoordinator):
+    """Detail sections of one station, refreshed on their own schedule.
+
+    Each section follows its own cadence from ``SECTION_REFRESH_INTERVALS``.
+    Sections that are not due are served from the cache, and so are due
+    sections whose fetch failed or was skipped by an open circuit breaker
+    (day sections only within the same day).
+
+    Sections are served stale-while-revalidate: a due section that still has
+    a usable cached value is served at once and refetched in a background
+    task, which updates the item and notifies the listeners when done. Only
+    sections without a usable value block the update. The item carries the
+    fetch time of its sections under ``section_updated_at``.
+
+    ``data`` is the station item. Its station payload, status count and
+    alerts come from the station list coordinator. Failures only affect this
+    station, and the update interval follows ``AdaptivePollingPolicy`` on
+    this station alone. Like the station list coordinator, a
+    ``refresh_offset`` is added once to the interval after the first
+    refresh.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: TsunMonitoringCoordinator,
+        station_id: int,
+        item: dict[str, Any],
+    ) -> None:
+        """Initialize."""
+        self.coordinator = coordinator
+        self.api = coordinator.api
+        self.station_id = station_id
+        self.restored_at: datetime | None = None
+        self.last_refresh: RefreshProfile | None = None
+        self.last_revalidation: RefreshProfile | None = None
+        self._polling_policy = AdaptivePollingPolicy()
+        self._section_cache: dict[str, CachedSection] = {}
+        self._stale_sections: list[str] = []
+        self._revalidating: set[str] = set()
+        self.refresh_offset = timedelta(0)
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} station {station_id}",
+            update_interval=UPDATE_INTERVAL,
+        )
+        self.data: dict[str, Any] = item
+
+    @property
+    def restored(self) -> bool:
+        """Return True while the sections come from the on-disk snapshot."""
+        return self.restored_at is not None
+
+    @callback
+    def async_restore(self, saved_at: datetime) -> None:
+        """Seed the section cache with the sections of a snapshot item.
+
+        Sections disabled since the snapshot was saved are dropped.
+        """
+        item = self.data
+        if isinstance(points := item.get("station_history_power_list"), list):
+            item["station_history_power_list"] = PowerSeries(points)
+        updated_at = item.get("section_updated_at") or {}
+        for section in STATION_SECTIONS:
+            keys = SECTION_KEYS[section]
+            if section in self.api.disabled_sections:
+                for key in keys:
+                    item.pop(key, None)
+                updated_at.pop(section, None)
+            elif all(key in item for key in keys):
+                fetched_at = (
+                    dt_util.parse_datetime(updated_at.get(section) or "") or saved_at
+                )
+                self._section_cache[section] = CachedSection(
+                    values={key: item[key] for key in keys},
+                    fetched_at=fetched_at,
+                    day=dt_util.as_local(fetched_at).date(),
+                )
+        self.restored_at = saved_at
+
+    def get_station_item(self, station_id: int) -> dict[str, Any] | None:
+        """Return the item of the station."""
+        return self.data if station_id == self.station_id else None
+
+    @callback
+    def async_set_station(self, item: dict[str, Any], now: datetime) -> None:
+        """Apply the station payload, status count and alerts of a list item."""
+        self.data["station"] = item["station"]
+        if (status_count := item.get("station_status_count")) is not None:
+            self.data["station_status_count"] = status_count
+        self._store_sections(item, (SECTION_ALERTS,), now)
+
+    def _store_sections(
+        self, fresh: dict[str, Any], sections: Collection[str], now: datetime
+    ) -> bool:
+        """Cache the sections found in ``fresh`` and apply them to the item.
+
+        The final points of the previous day, fetched with the first day
+        history of a new day, ride along with it until the statistics
+        importer consumes them.
+        """
+        day = dt_util.as_local(now).date()
+        stored = False
+        for section in sections:
+            keys = SECTION_KEYS[section]
+            if all(key in fresh for key in keys):
+                values = {key: fresh[key] for key in keys}
+                self._section_cache[section] = CachedSection(values, now, day)
+                self.data.update(values)
+                stored = True
+        if SECTION_HISTORY_DAY in sections and (
+            previous := fresh.get("station_history_previous_power_list")
+        ):
+            self.data["station_history_previous_power_list"] = previous
+        if stored:
+            self.data["section_updated_at"] = {
+                section: entry.fetched_at.isoformat()
+                for section, entry in self._section_cache.items()
+            }
+        return stored
+
+    def _select_sections(self) -> list[str]:
+        """Return the sections to fetch within the update.
+
+        Due sections with a usable cached value are set aside for background
+        revalidation instead, unless one is already running for them.
+        """
+        now = dt_util.utcnow()
+        today = dt_util.now().date()
+
+        blocking: list[str] = []
+        stale: list[str] = []
+        for section in STATION_DETAIL_SECTIONS:
+            if section in self.api.disabled_sections:
+                continue
+            entry = self._section_cache.get(section)
+            if entry is None or (section in DAILY_SECTIONS and entry.day != today):
+                blocking.append(section)
+            elif (
+                entry.day != today
+                or now - entry.fetched_at >= SECTION_REFRESH_INTERVALS[section]
+            ) and section not in self._revalidating:
+                stale.append(section)
+
+        self._stale_sections = stale
+        return blocking
+
+    @callback
+    def _async_schedule_revalidation(self) -> None:
+        """Refetch the stale sections of the update in the background."""
+        sections, self._stale_sections = self._stale_sections, []
+        if not sections:
+            return
+        self._revalidating.update(sections)
+        self.hass.async_create_background_task(
+            self._async_revalidate(sections),
+            f"{DOMAIN} revalidate station {self.station_id}",
+        )
+
+    async def _async_revalidate(self, sections: list[str]) -> None:
+        """Fetch stale sections and apply them to the item."""
+        profile = RefreshProfile()
+        fresh = {"station": self.data["station"]}
+        try:
+            with profile.phase("sections"), profile.activate():
+                await self.api.fetch_sections([(fresh, sections)])
+        finally:
+            self._revalidating.difference_update(sections)
+            profile.finish()
+            self.last_revalidation = profile
+
+        if self._store_sections(fresh, sections, dt_util.utcnow()):
+            self.async_update_listeners()
+
+    def _merge_sections(self, fresh: dict[str, Any], sections: list[str]) -> None:
+        """Store the fetched sections and drop day sections left from another day.
+
+        Sections that were due but did not come back keep their last known
+        good value, within the same day for day sections.
+        """
+        self._store_sections(fresh, sections, dt_util.utcnow())
+        today = dt_util.now().date()
+        for section in sections:
+            entry = self._section_cache.get(section)
+            if entry is None or entry.day != today:
+                for key in SECTION_KEYS[section]:
+                    self.data.pop(key, None)
+
+    def _adapt_update_interval(self) -> None:
+        """Pick the interval until the next update from the station power."""
+        sun_up, until_sunrise = _sun_state(self.hass)
+        interval = self._polling_policy.next_interval(
+            (self.data["station"],), sun_up, until_sunrise
+        )
+        if self.refresh_offset:
+            interval += self.refresh_offset
+            self.refresh_offset = timedelta(0)
+        self.update_interval = interval
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch the blocking sections and schedule the stale ones."""
+        profile = RefreshProfile()
+        sections = self._select_sections()
+        fresh = {"station": self.data["station"]}
+        try:
+            with profile.phase("sections"), profile.activate():
+                await self.api.fetch_sections([(fresh, sections)])
+        except Exception as err:
+            profile.finish()
+            self.last_refresh = profile
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+        with profile.phase("merge"):
+            self._merge_sections(fresh, sections)
+        self.restored_at = None
+        self._adapt_update_interval()
+        self._async_schedule_revalidation()
+        profile.finish()
+        self.last_refresh = profile
+        return self.data
+
+
+class TsunMonitoringLiveCoordinator(DataUpdateCoordinator):
+    """Fast lane polling only the station list for the live power sensors.
+
+    The station list carries ``generationPower``, ``batteryPower``,
+    ``usePower`` and ``batterySoc`` for every station in one request, so it is
+    polled far more often than the detailed refresh. When the adaptive policy
+    finds nothing moving (night, idle stations) the lane slows down to the
+    policy interval. Until its first update, items of the detailed
+    coordinator are served instead.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: TsunMonitoringCoordinator,
+        live_interval: timedelta = LIVE_UPDATE_INTERVAL,
+    ) -> None:
+        """Initialize."""
+        self.coordinator = coordinator
+        self.api = coordinator.api
+        self._live_interval = live_interval
+        self._polling_policy = AdaptivePollingPolicy()
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN} live",
+            update_interval=live_interval,
+        )
+
+    @property
+    def restored(self) -> bool:
+        """Return True while the served items come from the snapshot."""
+        return self.data is None and self.coordinator.restored
+
+    @property
+    def restored_at(self) -> datetime | None:
+        """Return when the served snapshot was saved."""
+        return self.coordinator.restored_at if self.data is None else None
+
+    def get_station_item(self, station_id: int) -> dict[str, Any] | None:
+        """Return the live item of a station, or the detailed one before."""
+        if self.data is None:
+            return self.coordinator.get_station_item(station_id)
+        return self.data.get(station_id)
+
+    async def _async_update_data(self) -> dict[int, dict[str, Any]]:
+        """Fetch the station list."""
         try:
-            return await self.hass.async_add_executor_job(self.api.get_stations)
+            stations = await self.api.get_station_list()
         except Exception as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+
+        sun_up, until_sunrise = _sun_state(self.hass)
+        interval = self._polling_policy.next_interval(
+            (item.get("station", {}) for item in stations), sun_up, until_sunrise
+        )
+        self.update_interval = (
+            self._live_interval if interval <= UPDATE_INTERVAL else interval
+        )
+
+        return {
+            item["station"]["id"]: item
+            for item in stations
+            if isinstance(item.get("station"), dict) and item["station"].get("id")
+        }
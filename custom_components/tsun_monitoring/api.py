@@ -1,14 +1,23 @@
 """API client for TSUN Monitoring."""
 from __future__ import annotations
 
-from datetime import datetime
+import asyncio
+from collections.abc import Callable, Collection
+from datetime import date, datetime
 import logging
+import time
 from typing import Any
+from urllib.parse import urlsplit
 
+import aiohttp
 import requests
 
 from .const import (
+    ALERTS_BULK_MAX_PAGES,
+    ALERTS_BULK_PAGE_SIZE,
+    ALERTS_PER_STATION,
     API_AUTH_URL,
+    API_BASE_URL,
     API_STATION_ALERT_LIST_URL,
     API_STATION_CURRENT_FLOW_URL,
     API_STATION_ENERGY_SAVED_URL,
@@ -18,31 +27,127 @@ from .const import (
     API_STATION_STATUS_COUNT_URL,
     API_STATION_URL,
     API_WEATHER_DAY_URL,
+    CIRCUIT_COOLDOWN,
+    CIRCUIT_FAILURE_THRESHOLD,
     CLIENT_ID,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_STATION_CONCURRENCY,
+    ENDPOINT_STATION_LIST,
+    ENDPOINT_STATUS_COUNT,
+    ENDPOINT_TIMEOUTS,
     IDENTITY_TYPE,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
+    SECTION_ALERTS,
+    SECTION_CURRENT_FLOW,
+    SECTION_DESCRIPTIONS,
+    SECTION_ENERGY_SAVED,
+    SECTION_HISTORY_DAY,
+    SECTION_MANAGE,
+    SECTION_SCENE,
+    SECTION_WEATHER_DAY,
+    STATION_SECTIONS,
     SYSTEM,
+    WEATHER_CACHE_TTL,
+)
+from .cache import AsyncTTLCache
+from .history import DayHistoryBuffer
+from .metrics import EndpointMetrics, RefreshProfile, count_request
+from .resilience import (
+    CIRCUIT_OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+    TokenBucket,
+    backoff_delay,
+    is_transient_error,
+    retry_after,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+ASYNC_REQUEST_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+"""Exceptions raised by the async client for transport or HTTP failures."""
 
-class TsunMonitoringAPI:
-    """API client for TSUN Monitoring."""
+_ASYNC_TIMEOUT = aiohttp.ClientTimeout(total=30)
 
-    def __init__(self, username: str, password: str) -> None:
-        """Initialize the API client."""
+# Access tokens are treated as expired this many seconds before their expiry.
+_TOKEN_EXPIRY_MARGIN = 60
+
+STATION_QUERY_REGION = {
+    "nationId": None,
+    "level1": None,
+    "level2": None,
+    "level3": None,
+    "level4": None,
+    "level5": None,
+}
+
+
+async def _response_json(response: aiohttp.ClientResponse) -> Any:
+    """Return the decoded JSON body of a response, whatever its content type.
+
+    A body that is not JSON, such as an HTML maintenance page, raises
+    ``aiohttp.ClientPayloadError`` so it is handled like any other request
+    failure in ``ASYNC_REQUEST_ERRORS``.
+    """
+    try:
+        return await response.json(content_type=None)
+    except ValueError as err:
+        raise aiohttp.ClientPayloadError(
+            f"Invalid JSON body from {response.url}: {err}"
+        ) from err
+
+
+def _day_params(day: date) -> dict[str, str]:
+    """Return the year/month/day query parameters used by daily endpoints."""
+    return {
+        "year": f"{day.year:04d}",
+        "month": f"{day.month:02d}",
+        "day": f"{day.day:02d}",
+    }
+
+
+class _TsunMonitoringAPIBase:
+    """Shared state and request builders for the sync and async clients."""
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        base_url: str = API_BASE_URL,
+        disabled_sections: Collection[str] = (),
+        now: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        """Initialize the shared client state.
+
+        ``base_url`` replaces the origin of every API URL, e.g. to point the
+        client at a local stand-in server. Sections listed in
+        ``disabled_sections`` are never requested. ``now`` returns the local
+        time the days of daily endpoints are taken from, the host clock by
+        default.
+        """
         self.username = username
         self.password = password
+        self.base_url = base_url.rstrip("/")
+        self.disabled_sections = frozenset(disabled_sections)
+        self.now = now
         self.access_token: str | None = None
         self.refresh_token: str | None = None
-        self.session = requests.Session()
+
+    def _url(self, url: str) -> str:
+        """Return an API URL from ``const`` rebased on ``base_url``."""
+        if self.base_url == API_BASE_URL or not url.startswith(API_BASE_URL):
+            return url
+        return self.base_url + url[len(API_BASE_URL) :]
 
     def _default_headers(self) -> dict[str, str]:
         """Return the common API headers used by the official app."""
         return {
             "Accept-Encoding": "gzip",
             "Connection": "Keep-Alive",
-            "Host": "pro.talent-monitoring.com",
+            "Host": urlsplit(self.base_url).netloc,
             "log-channel": "android",
             "log-client-inner-version": "18",
             "log-client-version": "1.0.15",
@@ -52,17 +157,112 @@ class TsunMonitoringAPI:
             "User-Agent": "okhttp/4.9.3",
         }
 
-    def _authorized_headers(self, content_type: str | None = None) -> dict[str, str]:
-        """Return authorization headers with optional content type."""
+    def _request_headers(self, content_type: str | None = None) -> dict[str, str]:
+        """Return request headers with optional content type, without token."""
         headers = self._default_headers()
         if content_type:
             headers["Content-Type"] = content_type
+        return headers
+
+    def _authorized_headers(self, content_type: str | None = None) -> dict[str, str]:
+        """Return authorization headers with optional content type."""
+        headers = self._request_headers(content_type)
         headers["authorization"] = f"bearer {self.access_token}"
         return headers
 
+    def _password_grant_data(self) -> dict[str, str]:
+        """Return the form body for a password grant."""
+        return {
+            "grant_type": "password",
+            "username": self.username,
+            "password": self.password,
+            "client_id": CLIENT_ID,
+            "identity_type": IDENTITY_TYPE,
+            "system": SYSTEM,
+        }
+
+    def _refresh_grant_data(self) -> dict[str, str]:
+        """Return the form body for a refresh token grant."""
+        return {
+            "grant_type": "refresh_token",
+            "refresh_token": self.refresh_token,
+            "client_id": CLIENT_ID,
+            "identity_type": IDENTITY_TYPE,
+            "system": SYSTEM,
+        }
+
+    @staticmethod
+    def _station_list_request() -> tuple[dict[str, Any], dict[str, str]]:
+        """Return the body and query parameters of the station list request."""
+        body = {
+            "region": dict(STATION_QUERY_REGION),
+            "returnTag": True,
+            "powerTypeList": None,
+        }
+        params = {
+            "order.direction": "ASC",
+            "order.property": "name",
+            "page": "1",
+            "size": "9999",
+        }
+        return body, params
+
+    @staticmethod
+    def _station_alerts_request(
+        station_ids: list[int], page: int = 1, size: int = 50
+    ) -> tuple[dict[str, Any], dict[str, str]]:
+        """Return the body and query parameters of the alert list request."""
+        params = {
+            "page": str(page),
+            "size": str(size),
+            "order.direction": "DESC",
+            "order.property": "startTime",
+        }
+        body = {
+            "stationIdList": station_ids,
+            "alertStatusList": None,
+            "alertTypeList": None,
+            "startTime": None,
+            "endTime": None,
+            "word": None,
+        }
+        return body, params
+
+    def _weather_params(
+        self,
+        region_nation_id: int,
+        region_level1: int,
+        region_level2: int,
+    ) -> dict[str, str]:
+        """Return the query parameters of the day weather request."""
+        return {
+            **_day_params(self.now()),
+            "regionNationId": str(region_nation_id),
+            "regionLevel1": str(region_level1),
+            "regionLevel2": str(region_level2),
+            "lan": "fr",
+        }
+
+
+class TsunMonitoringAPI(_TsunMonitoringAPIBase):
+    """API client for TSUN Monitoring."""
+
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        base_url: str = API_BASE_URL,
+        disabled_sections: Collection[str] = (),
+        now: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        """Initialize the API client."""
+        super().__init__(username, password, base_url, disabled_sections, now)
+        self.session = requests.Session()
+
     def _request_with_reauth(self, method: str, url: str, **kwargs) -> requests.Response:
         """Perform a request and retry once on unauthorized responses."""
         self._ensure_authenticated()
+        url = self._url(url)
 
         headers = kwargs.pop("headers", {})
         if "authorization" not in headers:
@@ -92,18 +292,11 @@ class TsunMonitoringAPI:
         headers = self._default_headers()
         headers["Content-Type"] = "application/x-www-form-urlencoded"
 
-        data = {
-            "grant_type": "password",
-            "username": self.username,
-            "password": self.password,
-            "client_id": CLIENT_ID,
-            "identity_type": IDENTITY_TYPE,
-            "system": SYSTEM,
-        }
+        data = self._password_grant_data()
 
         try:
             response = self.session.post(
-                API_AUTH_URL,
+                self._url(API_AUTH_URL),
                 headers=headers,
                 data=data,
                 timeout=30,
@@ -129,17 +322,11 @@ class TsunMonitoringAPI:
         headers = self._default_headers()
         headers["Content-Type"] = "application/x-www-form-urlencoded"
 
-        data = {
-            "grant_type": "refresh_token",
-            "refresh_token": self.refresh_token,
-            "client_id": CLIENT_ID,
-            "identity_type": IDENTITY_TYPE,
-            "system": SYSTEM,
-        }
+        data = self._refresh_grant_data()
 
         try:
             response = self.session.post(
-                API_AUTH_URL,
+                self._url(API_AUTH_URL),
                 headers=headers,
                 data=data,
                 timeout=30,
@@ -174,26 +361,7 @@ class TsunMonitoringAPI:
     def get_stations(self) -> list[dict[str, Any]]:
         """Get all stations data."""
         headers = self._authorized_headers(content_type="application/json")
-
-        body = {
-            "region": {
-                "nationId": None,
-                "level1": None,
-                "level2": None,
-                "level3": None,
-                "level4": None,
-                "level5": None,
-            },
-            "returnTag": True,
-            "powerTypeList": None,
-        }
-
-        params = {
-            "order.direction": "ASC",
-            "order.property": "name",
-            "page": "1",
-            "size": "9999",
-        }
+        body, params = self._station_list_request()
 
         try:
             try:
@@ -222,79 +390,100 @@ class TsunMonitoringAPI:
                 if station_status_count is not None:
                     item["station_status_count"] = station_status_count
 
-                try:
-                    history_data = self.get_station_history_day(station_id)
-                    item["station_history_day"] = history_data.get("stationStatisticDay")
-                    item["station_history_power_list"] = history_data.get(
-                        "stationStatisticPowerList", []
-                    )
-                    item["station_history_segment_day"] = history_data.get(
-                        "stationStatisticSegmentDay"
-                    )
-                except requests.exceptions.RequestException as err:
-                    _LOGGER.warning(
-                        "Failed to get day history for station %s: %s", station_id, err
-                    )
+                if SECTION_HISTORY_DAY not in self.disabled_sections:
+                    try:
+                        history_data = self.get_station_history_day(station_id)
+                        item["station_history_day"] = history_data.get(
+                            "stationStatisticDay"
+                        )
+                        item["station_history_power_list"] = history_data.get(
+                            "stationStatisticPowerList", []
+                        )
+                        item["station_history_segment_day"] = history_data.get(
+                            "stationStatisticSegmentDay"
+                        )
+                    except requests.exceptions.RequestException as err:
+                        _LOGGER.warning(
+                            "Failed to get day history for station %s: %s",
+                            station_id,
+                            err,
+                        )
 
-                try:
-                    region_nation_id = station.get("regionNationId")
-                    region_level1 = station.get("regionLevel1")
-                    region_level2 = station.get("regionLevel2")
-                    if (
-                        region_nation_id is not None
-                        and region_level1 is not None
-                        and region_level2 is not None
-                    ):
-                        item["weather_day"] = self.get_weather_day(
-                            region_nation_id,
-                            region_level1,
-                            region_level2,
+                if SECTION_WEATHER_DAY not in self.disabled_sections:
+                    try:
+                        region_nation_id = station.get("regionNationId")
+                        region_level1 = station.get("regionLevel1")
+                        region_level2 = station.get("regionLevel2")
+                        if (
+                            region_nation_id is not None
+                            and region_level1 is not None
+                            and region_level2 is not None
+                        ):
+                            item["weather_day"] = self.get_weather_day(
+                                region_nation_id,
+                                region_level1,
+                                region_level2,
+                            )
+                    except requests.exceptions.RequestException as err:
+                        _LOGGER.warning(
+                            "Failed to get day weather for station %s: %s",
+                            station_id,
+                            err,
                         )
-                except requests.exceptions.RequestException as err:
-                    _LOGGER.warning(
-                        "Failed to get day weather for station %s: %s", station_id, err
-                    )
 
-                try:
-                    item["station_manage"] = self.get_station_manage(station_id)
-                except requests.exceptions.RequestException as err:
-                    _LOGGER.warning(
-                        "Failed to get station manage for station %s: %s",
-                        station_id,
-                        err,
-                    )
+                if SECTION_MANAGE not in self.disabled_sections:
+                    try:
+                        item["station_manage"] = self.get_station_manage(station_id)
+                    except requests.exceptions.RequestException as err:
+                        _LOGGER.warning(
+                            "Failed to get station manage for station %s: %s",
+                            station_id,
+                            err,
+                        )
 
-                try:
-                    item["station_energy_saved"] = self.get_station_energy_saved(station_id)
-                except requests.exceptions.RequestException as err:
-                    _LOGGER.warning(
-                        "Failed to get station energy saved for station %s: %s",
-                        station_id,
-                        err,
-                    )
+                if SECTION_ENERGY_SAVED not in self.disabled_sections:
+                    try:
+                        item["station_energy_saved"] = self.get_station_energy_saved(
+                            station_id
+                        )
+                    except requests.exceptions.RequestException as err:
+                        _LOGGER.warning(
+                            "Failed to get station energy saved for station %s: %s",
+                            station_id,
+                            err,
+                        )
 
-                try:
-                    item["station_current_flow"] = self.get_station_current_flow(station_id)
-                except requests.exceptions.RequestException as err:
-                    _LOGGER.warning(
-                        "Failed to get station current flow for station %s: %s",
-                        station_id,
-                        err,
-                    )
+                if SECTION_CURRENT_FLOW not in self.disabled_sections:
+                    try:
+                        item["station_current_flow"] = self.get_station_current_flow(
+                            station_id
+                        )
+                    except requests.exceptions.RequestException as err:
+                        _LOGGER.warning(
+                            "Failed to get station current flow for station %s: %s",
+                            station_id,
+                            err,
+                        )
 
-                try:
-                    item["station_scene"] = self.get_station_scene(station_id)
-                except requests.exceptions.RequestException as err:
-                    _LOGGER.warning(
-                        "Failed to get station scene for station %s: %s", station_id, err
-                    )
+                if SECTION_SCENE not in self.disabled_sections:
+                    try:
+                        item["station_scene"] = self.get_station_scene(station_id)
+                    except requests.exceptions.RequestException as err:
+                        _LOGGER.warning(
+                            "Failed to get station scene for station %s: %s",
+                            station_id,
+                            err,
+                        )
 
-                try:
-                    item["station_alerts"] = self.get_station_alerts(station_id)
-                except requests.exceptions.RequestException as err:
-                    _LOGGER.warning(
-                        "Failed to get station alerts for station %s: %s", station_id, err
-                    )
+                if SECTION_ALERTS not in self.disabled_sections:
+                    try:
+                        item["station_alerts"] = self.get_station_alerts(station_id)
+                    except requests.exceptions.RequestException as err:
+                        _LOGGER.warning(
+                            "Failed to get station alerts for station %s: %s",
+                            station_id,
+                            err,
+                        )
 
             _LOGGER.info("Retrieved %d stations", len(stations))
             return stations
@@ -303,14 +492,11 @@ class TsunMonitoringAPI:
             _LOGGER.error("Failed to get stations: %s", err)
             raise
 
-    def get_station_history_day(self, station_id: int) -> dict[str, Any]:
+    def get_station_history_day(
+        self, station_id: int, day: date | None = None
+    ) -> dict[str, Any]:
         """Get station day history used by charts in the official app."""
-        now = datetime.now()
-        params = {
-            "year": f"{now.year:04d}",
-            "month": f"{now.month:02d}",
-            "day": f"{now.day:02d}",
-        }
+        params = _day_params(day or self.now())
         headers = self._authorized_headers()
 
         response = self._request_with_reauth(
@@ -328,16 +514,7 @@ class TsunMonitoringAPI:
         region_level2: int,
     ) -> list[dict[str, Any]]:
         """Get day weather forecast used by charts in the official app."""
-        now = datetime.now()
-        params = {
-            "year": f"{now.year:04d}",
-            "month": f"{now.month:02d}",
-            "day": f"{now.day:02d}",
-            "regionNationId": str(region_nation_id),
-            "regionLevel1": str(region_level1),
-            "regionLevel2": str(region_level2),
-            "lan": "fr",
-        }
+        params = self._weather_params(region_nation_id, region_level1, region_level2)
         headers = self._authorized_headers()
 
         response = self._request_with_reauth(
@@ -353,14 +530,7 @@ class TsunMonitoringAPI:
         """Get station communication and alert summary counts."""
         headers = self._authorized_headers(content_type="application/json")
         body = {
-            "region": {
-                "nationId": None,
-                "level1": None,
-                "level2": None,
-                "level3": None,
-                "level4": None,
-                "level5": None,
-            },
+            "region": dict(STATION_QUERY_REGION),
             "powerTypeList": None,
         }
         response = self._request_with_reauth(
@@ -396,12 +566,7 @@ class TsunMonitoringAPI:
 
     def get_station_current_flow(self, station_id: int) -> dict[str, Any]:
         """Get current flow data for the selected day."""
-        now = datetime.now()
-        params = {
-            "year": f"{now.year:04d}",
-            "month": f"{now.month:02d}",
-            "day": f"{now.day:02d}",
-        }
+        params = _day_params(self.now())
         headers = self._authorized_headers()
         response = self._request_with_reauth(
             "GET",
@@ -426,26 +591,765 @@ class TsunMonitoringAPI:
     def get_station_alerts(self, station_id: int) -> dict[str, Any]:
         """Get latest station alerts."""
         headers = self._authorized_headers(content_type="application/json")
-        params = {
-            "page": "1",
-            "size": "50",
-            "order.direction": "DESC",
-            "order.property": "startTime",
+        body, params = self._station_alerts_request([station_id])
+        response = self._request_with_reauth(
+            "POST",
+            API_STATION_ALERT_LIST_URL,
+            headers=headers,
+            params=params,
+            json=body,
+        )
+        data = response.json()
+        return data if isinstance(data, dict) else {}
+
+
+class TsunMonitoringAsyncAPI(_TsunMonitoringAPIBase):
+    """Asyncio API client for TSUN Monitoring.
+
+    Mirrors the public methods of :class:`TsunMonitoringAPI` but runs on the
+    event loop through a caller-provided ``aiohttp`` session, typically the
+    pooled session shared by Home Assistant. Every request, token grants
+    included, first takes a token from ``rate_limiter`` when one is given.
+    With ``complete_previous_day``, the previous day history is fetched one
+    last time at the day rollover, for the statistics importer.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        username: str,
+        password: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        station_concurrency: int = DEFAULT_STATION_CONCURRENCY,
+        base_url: str = API_BASE_URL,
+        rate_limiter: TokenBucket | None = None,
+        disabled_sections: Collection[str] = (),
+        complete_previous_day: bool = False,
+        now: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        """Initialize the API client."""
+        super().__init__(username, password, base_url, disabled_sections, now)
+        self.session = session
+        self.complete_previous_day = complete_previous_day
+        self.rate_limiter = rate_limiter
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.station_concurrency = max(1, int(station_concurrency))
+        self._account_limit = asyncio.Semaphore(self.max_concurrency)
+        self._auth_lock = asyncio.Lock()
+        self._history_buffers: dict[int, DayHistoryBuffer] = {}
+        self.weather_cache: AsyncTTLCache[list[dict[str, Any]]] = AsyncTTLCache(
+            WEATHER_CACHE_TTL.total_seconds()
+        )
+        self.token_expires_at: float | None = None
+        self.token_update_callback: Callable[[dict[str, Any]], None] | None = None
+        self.circuit_breakers: dict[str, CircuitBreaker] = {}
+        self.endpoint_metrics: dict[str, EndpointMetrics] = {}
+
+    @property
+    def tokens(self) -> dict[str, Any]:
+        """Return the current OAuth tokens, suitable for persisting."""
+        return {
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token,
+            "expires_at": self.token_expires_at,
+        }
+
+    def restore_tokens(self, tokens: dict[str, Any]) -> None:
+        """Reuse tokens obtained earlier, e.g. loaded from storage."""
+        self.access_token = tokens.get("access_token")
+        self.refresh_token = tokens.get("refresh_token")
+        self.token_expires_at = tokens.get("expires_at")
+
+    def _store_tokens(self, json_data: dict[str, Any]) -> None:
+        """Keep the tokens of a grant response and notify the listener."""
+        self.access_token = json_data.get("access_token")
+        self.refresh_token = json_data.get("refresh_token", self.refresh_token)
+        expires_in = json_data.get("expires_in")
+        self.token_expires_at = (
+            time.time() + float(expires_in) - _TOKEN_EXPIRY_MARGIN
+            if isinstance(expires_in, (int, float))
+            else None
+        )
+        if self.access_token and self.token_update_callback is not None:
+            self.token_update_callback(self.tokens)
+
+    @property
+    def _access_token_valid(self) -> bool:
+        """Return True if an access token is held and not known to be expired."""
+        return bool(self.access_token) and (
+            self.token_expires_at is None or self.token_expires_at > time.time()
+        )
+
+    @property
+    def request_count(self) -> int:
+        """Return the number of requests sent so far, on every endpoint."""
+        return sum(metrics.requests for metrics in self.endpoint_metrics.values())
+
+    def _endpoint_metrics(self, endpoint: str) -> EndpointMetrics:
+        """Return the request metrics of an endpoint."""
+        if (metrics := self.endpoint_metrics.get(endpoint)) is None:
+            metrics = self.endpoint_metrics[endpoint] = EndpointMetrics(endpoint)
+        return metrics
+
+    def _circuit_breaker(self, endpoint: str) -> CircuitBreaker:
+        """Return the circuit breaker of an endpoint."""
+        if (breaker := self.circuit_breakers.get(endpoint)) is None:
+            breaker = self.circuit_breakers[endpoint] = CircuitBreaker(
+                endpoint,
+                CIRCUIT_FAILURE_THRESHOLD,
+                CIRCUIT_COOLDOWN.total_seconds(),
+            )
+        return breaker
+
+    async def _request_with_reauth(
+        self, method: str, url: str, endpoint: str, **kwargs
+    ) -> aiohttp.ClientResponse:
+        """Perform a request of an endpoint with retries and a circuit breaker.
+
+        Each endpoint has its own timeout from ``ENDPOINT_TIMEOUTS``. 5xx, 429
+        and transport failures are retried with jittered exponential backoff;
+        once retries are exhausted the failure counts against the endpoint's
+        circuit breaker, and an open circuit raises ``CircuitOpenError``
+        without sending anything. Unauthorized responses are retried once
+        after re-authenticating. Every request sent is recorded in the
+        endpoint's ``EndpointMetrics``.
+        """
+        breaker = self._circuit_breaker(endpoint)
+        metrics = self._endpoint_metrics(endpoint)
+        if not breaker.allow_request():
+            metrics.rejected += 1
+            raise CircuitOpenError(endpoint)
+
+        timeout = aiohttp.ClientTimeout(
+            total=ENDPOINT_TIMEOUTS.get(endpoint, DEFAULT_REQUEST_TIMEOUT)
+        )
+        attempt = 0
+        while True:
+            try:
+                response = await self._send_with_reauth(
+                    method, url, timeout, metrics, **kwargs
+                )
+            except ASYNC_REQUEST_ERRORS as err:
+                if not is_transient_error(err):
+                    # The endpoint answered: the failure is not its health.
+                    breaker.record_success()
+                    raise
+                if attempt >= RETRY_ATTEMPTS or breaker.state == CIRCUIT_OPEN:
+                    # Requests in flight when the circuit opened stop retrying.
+                    breaker.record_failure()
+                    raise
+                delay = backoff_delay(
+                    attempt, RETRY_BASE_DELAY, RETRY_MAX_DELAY, retry_after(err)
+                )
+                attempt += 1
+                metrics.retries += 1
+                _LOGGER.debug(
+                    "Retrying %s request in %.1f s (attempt %d): %s",
+                    endpoint,
+                    delay,
+                    attempt,
+                    err,
+                )
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    breaker.release()
+                    raise
+            except asyncio.CancelledError:
+                breaker.release()
+                raise
+            else:
+                breaker.record_success()
+                return response
+
+    async def _send(
+        self, method: str, url: str, metrics: EndpointMetrics, **kwargs
+    ) -> aiohttp.ClientResponse:
+        """Send one request, read its body and record it in the metrics.
+
+        The request also counts in the active refresh profile. The body is
+        read before returning so the connection goes back to the
+        pool; ``json()`` and ``text()`` remain usable on the result.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        count_request()
+        start = time.perf_counter()
+        try:
+            async with self.session.request(method, url, **kwargs) as response:
+                body = await response.read()
+        except ASYNC_REQUEST_ERRORS as err:
+            metrics.record(time.perf_counter() - start, type(err).__name__)
+            raise
+        metrics.record(time.perf_counter() - start, str(response.status), len(body))
+        return response
+
+    async def _send_with_reauth(
+        self,
+        method: str,
+        url: str,
+        timeout: aiohttp.ClientTimeout,
+        metrics: EndpointMetrics,
+        **kwargs,
+    ) -> aiohttp.ClientResponse:
+        """Send a request once, retrying once on unauthorized responses."""
+        await self.ensure_authenticated()
+        url = self._url(url)
+
+        # The token is set here, after any refresh by ensure_authenticated().
+        used_token = self.access_token
+        headers = {**kwargs.pop("headers", {}), "authorization": f"bearer {used_token}"}
+
+        response = await self._send(
+            method, url, metrics, headers=headers, timeout=timeout, **kwargs
+        )
+        if response.status != 401:
+            response.raise_for_status()
+            return response
+
+        async with self._auth_lock:
+            # Concurrent requests share the expired token: only the first one
+            # to get here re-authenticates, the others reuse its new token.
+            if self.access_token in (None, used_token):
+                _LOGGER.info("Access token expired, trying to re-authenticate")
+                self.access_token = None
+                if not await self.refresh_access_token():
+                    await self.authenticate()
+        headers["authorization"] = f"bearer {self.access_token}"
+        metrics.reauths += 1
+
+        response = await self._send(
+            method, url, metrics, headers=headers, timeout=timeout, **kwargs
+        )
+        response.raise_for_status()
+        return response
+
+    async def _token_request(self, data: dict[str, str]) -> dict[str, Any]:
+        """Post a grant to the OAuth endpoint and return the decoded payload."""
+        headers = self._default_headers()
+        headers["Content-Type"] = "application/x-www-form-urlencoded"
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        async with self.session.post(
+            self._url(API_AUTH_URL),
+            headers=headers,
+            data=data,
+            timeout=_ASYNC_TIMEOUT,
+        ) as response:
+            response.raise_for_status()
+            return await _response_json(response)
+
+    async def authenticate(self) -> bool:
+        """Authenticate with the API."""
+        try:
+            json_data = await self._token_request(self._password_grant_data())
+        except ASYNC_REQUEST_ERRORS as err:
+            _LOGGER.error("Authentication failed: %s", err)
+            raise
+
+        self.refresh_token = None
+        self._store_tokens(json_data)
+
+        _LOGGER.info("Authentication successful")
+        return True
+
+    async def refresh_access_token(self) -> bool:
+        """Refresh the access token using the refresh token."""
+        if not self.refresh_token:
+            return False
+
+        try:
+            json_data = await self._token_request(self._refresh_grant_data())
+        except ASYNC_REQUEST_ERRORS as err:
+            _LOGGER.warning("Token refresh failed: %s", err)
+            return False
+
+        self._store_tokens(json_data)
+
+        if not self.access_token:
+            _LOGGER.warning("Token refresh response did not include access_token")
+            return False
+
+        _LOGGER.info("Token refresh successful")
+        return True
+
+    async def ensure_authenticated(self) -> None:
+        """Ensure a valid access token is available.
+
+        A held, unexpired token is used as is; otherwise the refresh token
+        grant is tried before falling back to a password login.
+        """
+        if self._access_token_valid:
+            return
+
+        async with self._auth_lock:
+            if self._access_token_valid:
+                return
+
+            if await self.refresh_access_token():
+                return
+
+            await self.authenticate()
+
+    async def get_stations(
+        self,
+        select_sections: Callable[[dict[str, Any]], Collection[str]] | None = None,
+        profile: RefreshProfile | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get all stations data.
+
+        Per-station sub-requests run concurrently, bounded by
+        ``max_concurrency`` across the whole account and by
+        ``station_concurrency`` within a single station. A failure on one
+        endpoint only drops that endpoint's keys from the station item.
+
+        ``select_sections`` receives each station payload and returns the
+        detail sections to fetch for it; every section is fetched when omitted.
+        Alerts of every selected station come from one bulk request.
+
+        The ``status_count``, ``station_list`` and ``sections`` phases are
+        timed into ``profile`` when given.
+        """
+        if profile is None:
+            profile = RefreshProfile()
+        try:
+            try:
+                with profile.phase("status_count"):
+                    station_status_count = await self.get_station_status_count()
+            except ASYNC_REQUEST_ERRORS as err:
+                _LOGGER.warning("Failed to get station status count: %s", err)
+                station_status_count = None
+
+            with profile.phase("station_list"):
+                stations = await self.get_station_list()
+
+            station_ids = {item.get("station", {}).get("id") for item in stations}
+            for station_id in set(self._history_buffers) - station_ids:
+                del self._history_buffers[station_id]
+
+            station_items: list[tuple[dict[str, Any], list[str]]] = []
+            for item in stations:
+                station = item.get("station", {})
+                if not station.get("id"):
+                    continue
+                if station_status_count is not None:
+                    item["station_status_count"] = station_status_count
+                if select_sections is None:
+                    sections = list(STATION_SECTIONS)
+                else:
+                    sections = list(select_sections(station))
+                station_items.append((item, sections))
+
+            with profile.phase("sections"):
+                await self.fetch_sections(station_items)
+
+            _LOGGER.info("Retrieved %d stations", len(stations))
+            return stations
+
+        except ASYNC_REQUEST_ERRORS as err:
+            _LOGGER.error("Failed to get stations: %s", err)
+            raise
+
+    async def fetch_sections(
+        self, station_items: Collection[tuple[dict[str, Any], Collection[str]]]
+    ) -> None:
+        """Fetch detail sections into station items.
+
+        Each pair holds a station item (with at least its ``station`` payload)
+        and the sections to fetch into it. Concurrency is bounded as in
+        ``get_stations``, the account bound being shared by concurrent calls,
+        and a failed endpoint only leaves its keys out. Disabled sections are
+        left out as well.
+        """
+        disabled = self.disabled_sections
+        station_items = [
+            (item, [section for section in sections if section not in disabled])
+            for item, sections in station_items
+        ]
+        alert_items = {
+            item["station"]["id"]: item
+            for item, sections in station_items
+            if SECTION_ALERTS in sections
+        }
+
+        account_limit = self._account_limit
+        await asyncio.gather(
+            self._async_fill_alerts(alert_items, account_limit),
+            *(
+                self._async_fill_station(
+                    item,
+                    [section for section in sections if section != SECTION_ALERTS],
+                    account_limit,
+                )
+                for item, sections in station_items
+            ),
+        )
+
+    async def get_station_list(self) -> list[dict[str, Any]]:
+        """Get the station list only, without any detail section.
+
+        A single request covers every station, which makes it cheap enough
+        for the live power lane.
+        """
+        body, params = self._station_list_request()
+        response = await self._request_with_reauth(
+            "POST",
+            API_STATION_URL,
+            endpoint=ENDPOINT_STATION_LIST,
+            headers=self._request_headers(content_type="application/json"),
+            json=body,
+            params=params,
+        )
+        json_data = await _response_json(response)
+        return json_data.get("data", [])
+
+    async def _async_fill_alerts(
+        self,
+        items: dict[int, dict[str, Any]],
+        account_limit: asyncio.Semaphore,
+    ) -> None:
+        """Fetch the alerts of several stations in bulk into their items."""
+        if not items:
+            return
+
+        async with account_limit:
+            try:
+                alerts = await self.get_stations_alerts(list(items))
+            except ASYNC_REQUEST_ERRORS as err:
+                _LOGGER.warning(
+                    "Failed to get station alerts for %d stations: %s", len(items), err
+                )
+                return
+
+        for station_id, item in items.items():
+            item["station_alerts"] = alerts[station_id]
+
+    async def _async_fill_station(
+        self,
+        item: dict[str, Any],
+        sections: Collection[str],
+        account_limit: asyncio.Semaphore,
+    ) -> None:
+        """Fetch the given detail sections of one station into its item."""
+        station = item["station"]
+        station_id = station["id"]
+        station_limit = asyncio.Semaphore(self.station_concurrency)
+
+        async def fetch_section(section: str) -> None:
+            fetcher = getattr(self, f"_async_fetch_{section}")
+            async with station_limit, account_limit:
+                try:
+                    item.update(await fetcher(station))
+                except CircuitOpenError as err:
+                    _LOGGER.debug(
+                        "Skipped %s for station %s: %s",
+                        SECTION_DESCRIPTIONS[section],
+                        station_id,
+                        err,
+                    )
+                except ASYNC_REQUEST_ERRORS as err:
+                    _LOGGER.warning(
+                        "Failed to get %s for station %s: %s",
+                        SECTION_DESCRIPTIONS[section],
+                        station_id,
+                        err,
+                    )
+
+        await asyncio.gather(*(fetch_section(section) for section in sections))
+
+    async def _async_fetch_history_day(self, station: dict[str, Any]) -> dict[str, Any]:
+        """Return the day history keys of a station item.
+
+        Power points go through the station's day buffer. On the first fetch
+        of a new local day, with ``complete_previous_day``, the previous day is
+        fetched one last time so its final points are exposed under
+        ``station_history_previous_power_list`` before the buffer is reset.
+        """
+        station_id = station["id"]
+        today = self.now().date()
+        buffer = self._history_buffers.setdefault(station_id, DayHistoryBuffer())
+        result: dict[str, Any] = {}
+
+        if (
+            self.complete_previous_day
+            and buffer.day is not None
+            and buffer.day != today
+        ):
+            try:
+                previous = await self.get_station_history_day(station_id, buffer.day)
+            except ASYNC_REQUEST_ERRORS as err:
+                _LOGGER.warning(
+                    "Failed to complete day history of %s for station %s: %s",
+                    buffer.day,
+                    station_id,
+                    err,
+                )
+            else:
+                result["station_history_previous_power_list"] = buffer.extend(
+                    previous.get("stationStatisticPowerList") or []
+                )
+        if buffer.day != today:
+            buffer.reset(today)
+
+        history_data = await self.get_station_history_day(station_id, today)
+        result.update(
+            {
+                "station_history_day": history_data.get("stationStatisticDay"),
+                "station_history_power_list": buffer.extend(
+                    history_data.get("stationStatisticPowerList") or []
+                ),
+                "station_history_segment_day": history_data.get(
+                    "stationStatisticSegmentDay"
+                ),
+            }
+        )
+        return result
+
+    async def _async_fetch_weather_day(self, station: dict[str, Any]) -> dict[str, Any]:
+        """Return the day weather key of a station item, if it has a region."""
+        region_nation_id = station.get("regionNationId")
+        region_level1 = station.get("regionLevel1")
+        region_level2 = station.get("regionLevel2")
+        if region_nation_id is None or region_level1 is None or region_level2 is None:
+            return {}
+
+        # Weather only depends on the region and the day, so stations sharing
+        # a region reuse one response within and across refreshes.
+        key = (
+            region_nation_id,
+            region_level1,
+            region_level2,
+            self.now().date().isoformat(),
+        )
+        return {
+            "weather_day": await self.weather_cache.get_or_fetch(
+                key,
+                lambda: self.get_weather_day(
+                    region_nation_id,
+                    region_level1,
+                    region_level2,
+                ),
+            )
+        }
+
+    async def _async_fetch_manage(self, station: dict[str, Any]) -> dict[str, Any]:
+        """Return the station manage key of a station item."""
+        return {"station_manage": await self.get_station_manage(station["id"])}
+
+    async def _async_fetch_energy_saved(self, station: dict[str, Any]) -> dict[str, Any]:
+        """Return the energy saved key of a station item."""
+        return {
+            "station_energy_saved": await self.get_station_energy_saved(station["id"])
+        }
+
+    async def _async_fetch_current_flow(self, station: dict[str, Any]) -> dict[str, Any]:
+        """Return the current flow key of a station item."""
+        return {
+            "station_current_flow": await self.get_station_current_flow(station["id"])
+        }
+
+    async def _async_fetch_scene(self, station: dict[str, Any]) -> dict[str, Any]:
+        """Return the scene key of a station item."""
+        return {"station_scene": await self.get_station_scene(station["id"])}
+
+    async def get_stations_alerts(
+        self, station_ids: list[int]
+    ) -> dict[int, dict[str, Any]]:
+        """Get the latest alerts of several stations with paginated bulk requests.
+
+        Pages are requested newest first until every station holds
+        ``ALERTS_PER_STATION`` alerts, the list is exhausted or
+        ``ALERTS_BULK_MAX_PAGES`` is reached. Each station gets a payload shaped
+        like a single-station response, restricted to its own alerts.
+
+        The pages read are the cost bound: a station whose alerts are older
+        than the newest ``ALERTS_BULK_MAX_PAGES`` pages of the account keeps a
+        truncated list rather than costing requests of its own. ``total``
+        counts the alerts of the station in the pages read, which is exact
+        once the list is exhausted.
+        """
+        headers = self._request_headers(content_type="application/json")
+        per_station: dict[int, list[dict[str, Any]]] = {
+            station_id: [] for station_id in station_ids
         }
+        counts = dict.fromkeys(station_ids, 0)
+        first_page: dict[str, Any] = {}
+
+        for page in range(1, ALERTS_BULK_MAX_PAGES + 1):
+            body, params = self._station_alerts_request(
+                station_ids, page=page, size=ALERTS_BULK_PAGE_SIZE
+            )
+            response = await self._request_with_reauth(
+                "POST",
+                API_STATION_ALERT_LIST_URL,
+                endpoint=SECTION_ALERTS,
+                headers=headers,
+                params=params,
+                json=body,
+            )
+            data = await _response_json(response)
+            if not isinstance(data, dict):
+                break
+            if page == 1:
+                first_page = data
+
+            records = data.get("data") or []
+            for record in records:
+                station_id = record.get("stationId")
+                alerts = per_station.get(station_id)
+                if alerts is None:
+                    continue
+                counts[station_id] += 1
+                if len(alerts) < ALERTS_PER_STATION:
+                    alerts.append(record)
+
+            total = data.get("total")
+            if (
+                len(records) < ALERTS_BULK_PAGE_SIZE
+                or (isinstance(total, int) and page * ALERTS_BULK_PAGE_SIZE >= total)
+                or all(
+                    len(alerts) >= ALERTS_PER_STATION for alerts in per_station.values()
+                )
+            ):
+                break
+        else:
+            _LOGGER.debug(
+                "Alert list truncated after %d pages for %d stations",
+                ALERTS_BULK_MAX_PAGES,
+                len(station_ids),
+            )
+
+        meta = {
+            key: value
+            for key, value in first_page.items()
+            if key not in ("data", "total")
+        }
+        return {
+            station_id: {**meta, "data": alerts, "total": counts[station_id]}
+            for station_id, alerts in per_station.items()
+        }
+
+    async def get_station_history_day(
+        self,
+        station_id: int,
+        day: date | None = None,
+        endpoint: str = SECTION_HISTORY_DAY,
+    ) -> dict[str, Any]:
+        """Get station day history used by charts in the official app.
+
+        ``endpoint`` names the circuit breaker and metrics of the request.
+        """
+        params = _day_params(day or self.now())
+        headers = self._request_headers()
+
+        response = await self._request_with_reauth(
+            "GET",
+            f"{API_STATION_HISTORY_DAY_URL}/{station_id}",
+            endpoint=endpoint,
+            headers=headers,
+            params=params,
+        )
+        return await _response_json(response)
+
+    async def get_weather_day(
+        self,
+        region_nation_id: int,
+        region_level1: int,
+        region_level2: int,
+    ) -> list[dict[str, Any]]:
+        """Get day weather forecast used by charts in the official app."""
+        params = self._weather_params(region_nation_id, region_level1, region_level2)
+        headers = self._request_headers()
+
+        response = await self._request_with_reauth(
+            "GET",
+            API_WEATHER_DAY_URL,
+            endpoint=SECTION_WEATHER_DAY,
+            headers=headers,
+            params=params,
+        )
+        data = await _response_json(response)
+        return data if isinstance(data, list) else []
+
+    async def get_station_status_count(self) -> dict[str, Any]:
+        """Get station communication and alert summary counts."""
+        headers = self._request_headers(content_type="application/json")
         body = {
-            "stationIdList": [station_id],
-            "alertStatusList": None,
-            "alertTypeList": None,
-            "startTime": None,
-            "endTime": None,
-            "word": None,
+            "region": dict(STATION_QUERY_REGION),
+            "powerTypeList": None,
         }
-        response = self._request_with_reauth(
+        response = await self._request_with_reauth(
+            "POST",
+            API_STATION_STATUS_COUNT_URL,
+            endpoint=ENDPOINT_STATUS_COUNT,
+            headers=headers,
+            json=body,
+        )
+        data = await _response_json(response)
+        return data if isinstance(data, dict) else {}
+
+    async def get_station_manage(self, station_id: int) -> dict[str, Any]:
+        """Get station metadata and settings."""
+        headers = self._request_headers()
+        response = await self._request_with_reauth(
+            "GET",
+            f"{API_STATION_MANAGE_URL}/{station_id}",
+            endpoint=SECTION_MANAGE,
+            headers=headers,
+        )
+        data = await _response_json(response)
+        return data if isinstance(data, dict) else {}
+
+    async def get_station_energy_saved(self, station_id: int) -> dict[str, Any]:
+        """Get station environmental impact metrics."""
+        headers = self._request_headers()
+        response = await self._request_with_reauth(
+            "GET",
+            f"{API_STATION_ENERGY_SAVED_URL}/{station_id}",
+            endpoint=SECTION_ENERGY_SAVED,
+            headers=headers,
+        )
+        data = await _response_json(response)
+        return data if isinstance(data, dict) else {}
+
+    async def get_station_current_flow(self, station_id: int) -> dict[str, Any]:
+        """Get current flow data for the selected day."""
+        params = _day_params(self.now())
+        headers = self._request_headers()
+        response = await self._request_with_reauth(
+            "GET",
+            f"{API_STATION_CURRENT_FLOW_URL}/{station_id}",
+            endpoint=SECTION_CURRENT_FLOW,
+            headers=headers,
+            params=params,
+        )
+        data = await _response_json(response)
+        return data if isinstance(data, dict) else {}
+
+    async def get_station_scene(self, station_id: int) -> str | None:
+        """Get station scene identifier."""
+        headers = self._request_headers()
+        response = await self._request_with_reauth(
+            "GET",
+            f"{API_STATION_SCENE_URL}/{station_id}",
+            endpoint=SECTION_SCENE,
+            headers=headers,
+        )
+        data = (await response.text()).strip()
+        return data or None
+
+    async def get_station_alerts(self, station_id: int) -> dict[str, Any]:
+        """Get latest station alerts."""
+        headers = self._request_headers(content_type="application/json")
+        body, params = self._station_alerts_request([station_id])
+        response = await self._request_with_reauth(
             "POST",
             API_STATION_ALERT_LIST_URL,
+            endpoint=SECTION_ALERTS,
             headers=headers,
             params=params,
             json=body,
         )
-        data = response.json()
+        data = await _response_json(response)
         return data if isinstance(data, dict) else {}
@@ -0,0 +1,271 @@
+"""Backfill of past station day curves into long-term statistics."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Collection, Mapping
+from datetime import date, timedelta
+import logging
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import ASYNC_REQUEST_ERRORS, TsunMonitoringAsyncAPI
+from .const import (
+    BACKFILL_BATCH_DAYS,
+    BACKFILL_CONCURRENCY,
+    DOMAIN,
+    ENDPOINT_HISTORY_BACKFILL,
+    SERVICE_BACKFILL_HISTORY,
+)
+from .series import PowerSeries
+from .statistics import async_import_history
+
+_LOGGER = logging.getLogger(__name__)
+
+BACKFILL_STORAGE_KEY = f"{DOMAIN}.backfill"
+BACKFILL_STORAGE_VERSION = 1
+BACKFILL_SAVE_DELAY = 1
+
+DATA_BACKFILL = f"{DOMAIN}_backfill"
+
+BACKFILL_SCHEMA = vol.Schema(
+    {
+        vol.Required("station_id"): vol.Coerce(int),
+        vol.Required("start_date"): cv.date,
+        vol.Required("end_date"): cv.date,
+    }
+)
+
+
+class HistoryBackfill:
+    """Fetch past day curves of stations and import them as statistics.
+
+    A job covers one station and a date range. Its days are fetched in
+    batches of ``BACKFILL_BATCH_DAYS``, with at most ``BACKFILL_CONCURRENCY``
+    requests in flight across every job, and each batch is imported in one
+    call per statistic. Imported days are persisted, so an interrupted job
+    resumes where it stopped when its entry is set up again or the service is
+    called again with the same range. Days that failed are left for the next
+    run.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the backfill."""
+        self.hass = hass
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, BACKFILL_STORAGE_VERSION, BACKFILL_STORAGE_KEY
+        )
+        # Unfinished jobs by station id, as stored.
+        self._jobs: dict[str, dict[str, Any]] = {}
+        self._tasks: dict[int, asyncio.Task] = {}
+        self._limit = asyncio.Semaphore(BACKFILL_CONCURRENCY)
+
+    async def async_load(self) -> None:
+        """Load the unfinished jobs."""
+        self._jobs = await self._store.async_load() or {}
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule a save of the jobs."""
+        self._store.async_delay_save(lambda: self._jobs, BACKFILL_SAVE_DELAY)
+
+    @callback
+    def async_start(
+        self,
+        entry: ConfigEntry,
+        api: TsunMonitoringAsyncAPI,
+        station_id: int,
+        station_name: str,
+        start: date,
+        end: date,
+    ) -> None:
+        """Start backfilling a station, resuming a job over the same range."""
+        if station_id in self._tasks:
+            raise ServiceValidationError(
+                f"A backfill of station {station_id} is already running"
+            )
+        job = self._jobs.get(str(station_id))
+        if job is None or (job["start"], job["end"]) != (
+            start.isoformat(),
+            end.isoformat(),
+        ):
+            job = self._jobs[str(station_id)] = {
+                "start": start.isoformat(),
+                "end": end.isoformat(),
+                "done": [],
+            }
+            self._async_schedule_save()
+        self._async_run_job(entry, api, station_id, station_name, job)
+
+    @callback
+    def async_resume(
+        self,
+        entry: ConfigEntry,
+        api: TsunMonitoringAsyncAPI,
+        station_names: Mapping[int, str],
+    ) -> None:
+        """Restart the unfinished jobs of the stations of an entry."""
+        for key, job in self._jobs.items():
+            station_id = int(key)
+            if station_id in station_names and station_id not in self._tasks:
+                self._async_run_job(
+                    entry, api, station_id, station_names[station_id], job
+                )
+
+    @callback
+    def _async_run_job(
+        self,
+        entry: ConfigEntry,
+        api: TsunMonitoringAsyncAPI,
+        station_id: int,
+        station_name: str,
+        job: dict[str, Any],
+    ) -> None:
+        """Run a job in a background task, cancelled with its entry."""
+        task = entry.async_create_background_task(
+            self.hass,
+            self._async_run(api, station_id, station_name, job),
+            f"{DOMAIN} backfill station {station_id}",
+        )
+        self._tasks[station_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(station_id, None))
+
+    async def _async_run(
+        self,
+        api: TsunMonitoringAsyncAPI,
+        station_id: int,
+        station_name: str,
+        job: dict[str, Any],
+    ) -> None:
+        """Fetch and import the days of a job that are not done yet."""
+        start = date.fromisoformat(job["start"])
+        end = date.fromisoformat(job["end"])
+        done = set(job["done"])
+        days = [
+            day
+            for offset in range((end - start).days + 1)
+            if (day := start + timedelta(days=offset)).isoformat() not in done
+        ]
+        _LOGGER.info("Backfilling %d days of station %s", len(days), station_id)
+
+        failed = 0
+        for offset in range(0, len(days), BACKFILL_BATCH_DAYS):
+            batch = days[offset : offset + BACKFILL_BATCH_DAYS]
+            results = await asyncio.gather(
+                *(self._async_fetch_day(api, station_id, day) for day in batch)
+            )
+            points = PowerSeries()
+            for day, day_points in zip(batch, results):
+                if day_points is None:
+                    failed += 1
+                    continue
+                points.extend(day_points)
+                job["done"].append(day.isoformat())
+            rows = async_import_history(self.hass, station_id, station_name, points)
+            self._async_schedule_save()
+            _LOGGER.debug(
+                "Backfilled %s to %s of station %s: %d hourly rows",
+                batch[0],
+                batch[-1],
+                station_id,
+                rows,
+            )
+
+        if failed:
+            _LOGGER.warning(
+                "Backfill of station %s left %d failed days, call the service "
+                "again to retry them",
+                station_id,
+                failed,
+            )
+            return
+        self._jobs.pop(str(station_id), None)
+        self._async_schedule_save()
+        _LOGGER.info("Backfill of station %s done", station_id)
+
+    async def _async_fetch_day(
+        self, api: TsunMonitoringAsyncAPI, station_id: int, day: date
+    ) -> list[dict[str, Any]] | None:
+        """Return the power points of a past day, or None on failure."""
+        async with self._limit:
+            try:
+                history_data = await api.get_station_history_day(
+                    station_id, day, endpoint=ENDPOINT_HISTORY_BACKFILL
+                )
+            except ASYNC_REQUEST_ERRORS as err:
+                _LOGGER.warning(
+                    "Failed to backfill day history of %s for station %s: %s",
+                    day,
+                    station_id,
+                    err,
+                )
+                return None
+        return history_data.get("stationStatisticPowerList") or []
+
+    def as_dict(self, station_ids: Collection[int]) -> dict[str, Any]:
+        """Return the unfinished jobs of some stations for diagnostics."""
+        return {
+            key: {
+                "start": job["start"],
+                "end": job["end"],
+                "days_done": len(job["done"]),
+                "running": int(key) in self._tasks,
+            }
+            for key, job in self._jobs.items()
+            if int(key) in station_ids
+        }
+
+
+@singleton(DATA_BACKFILL)
+async def async_get_backfill(hass: HomeAssistant) -> HistoryBackfill:
+    """Return the shared backfill, loading its jobs on first use."""
+    backfill = HistoryBackfill(hass)
+    await backfill.async_load()
+    return backfill
+
+
+@callback
+def async_register_backfill_service(hass: HomeAssistant) -> None:
+    """Register the history backfill service."""
+
+    async def _async_backfill_history(call: ServiceCall) -> None:
+        """Start backfilling the day curves of a station."""
+        station_id = call.data["station_id"]
+        start = call.data["start_date"]
+        end = call.data["end_date"]
+        if start > end:
+            raise ServiceValidationError("start_date must not be after end_date")
+        if end > dt_util.now().date():
+            raise ServiceValidationError("end_date must not be in the future")
+
+        for entry_id, entry_data in hass.data.get(DOMAIN, {}).items():
+            coordinator = entry_data.coordinator
+            if (station := coordinator.stations.get(station_id)) is not None:
+                break
+        else:
+            raise ServiceValidationError(f"Unknown station {station_id}")
+
+        backfill = await async_get_backfill(hass)
+        backfill.async_start(
+            hass.config_entries.async_get_entry(entry_id),
+            coordinator.api,
+            station_id,
+            station.data.get("station", {}).get("name", str(station_id)),
+            start,
+            end,
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BACKFILL_HISTORY,
+        _async_backfill_history,
+        schema=BACKFILL_SCHEMA,
+    )
@@ -0,0 +1,76 @@
+"""Small caches used by the TSUN Monitoring API client."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+import time
+from typing import Any, Generic, TypeVar
+
+_T = TypeVar("_T")
+
+
+class AsyncTTLCache(Generic[_T]):
+    """Time-bounded cache of coroutine results with in-flight deduplication.
+
+    Concurrent lookups of the same missing key share a single call to the
+    factory. Failed calls are not cached. Hits and misses are counted so the
+    cache efficiency can be reported in diagnostics.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        """Initialize the cache with a time-to-live in seconds."""
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[Hashable, tuple[float, _T]] = {}
+        self._pending: dict[Hashable, asyncio.Future[_T]] = {}
+
+    async def get_or_fetch(
+        self, key: Hashable, factory: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Return the cached value of ``key`` or fetch it with ``factory``."""
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > now:
+            self.hits += 1
+            return entry[1]
+
+        if (pending := self._pending.get(key)) is not None:
+            self.hits += 1
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future: asyncio.Future[_T] = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            # Mark the exception as retrieved when nobody else was waiting.
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            self._purge(now)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            return value
+        finally:
+            del self._pending[key]
+
+    def _purge(self, now: float) -> None:
+        """Drop expired entries."""
+        for key in [key for key, (expires, _) in self._entries.items() if expires <= now]:
+            del self._entries[key]
+
+    def stats(self) -> dict[str, Any]:
+        """Return hit/miss counters for diagnostics."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else None,
+        }
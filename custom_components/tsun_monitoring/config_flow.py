@@ -8,10 +8,33 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import selector
 
-from .const import DOMAIN
+from .api import ASYNC_REQUEST_ERRORS, TsunMonitoringAsyncAPI
+
+from .const import (
+    API_BASE_URL,
+    CONF_DAY_GRAPH_STATISTICS,
+    CONF_DISABLED_SECTIONS,
+    CONF_DYNAMIC_SENSORS,
+    CONF_GRAPH_POINTS,
+    CONF_LIVE_INTERVAL,
+    CONF_MAX_CONCURRENCY,
+    CONF_STATION_CONCURRENCY,
+    DEFAULT_GRAPH_POINTS,
+    DEFAULT_LIVE_INTERVAL,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_STATION_CONCURRENCY,
+    DOMAIN,
+    OPTIONAL_SECTIONS,
+)
+from .entity_ids import dynamic_sensor_key
+from .limits import async_get_rate_limiter
+from .storage import async_get_token_store
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,7 +42,15 @@ _LOGGER = logging.getLogger(__name__)
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for TSUN Monitoring."""
 
-    VERSION = 1
+    VERSION = 2
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler()
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -32,10 +63,28 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             await self.async_set_unique_id(user_input[CONF_USERNAME])
             self._abort_if_unique_id_configured()
 
-            return self.async_create_entry(
-                title=f"TSUN ({user_input[CONF_USERNAME]})",
-                data=user_input,
+            api = TsunMonitoringAsyncAPI(
+                session=async_get_clientsession(self.hass),
+                username=user_input[CONF_USERNAME],
+                password=user_input[CONF_PASSWORD],
+                rate_limiter=async_get_rate_limiter(self.hass, API_BASE_URL),
             )
+            try:
+                await api.authenticate()
+            except ASYNC_REQUEST_ERRORS:
+                errors["base"] = "cannot_connect"
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected error during authentication")
+                errors["base"] = "unknown"
+            else:
+                # Hand the fresh token to the entry setup.
+                token_store = await async_get_token_store(self.hass)
+                token_store.async_set(user_input[CONF_USERNAME], api.tokens)
+
+                return self.async_create_entry(
+                    title=f"TSUN ({user_input[CONF_USERNAME]})",
+                    data=user_input,
+                )
 
         data_schema = vol.Schema(
             {
@@ -53,3 +102,129 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=data_schema,
             errors=errors,
         )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle TSUN Monitoring options."""
+
+    def _dynamic_sensor_entries(self) -> list[tuple[er.RegistryEntry, str]]:
+        """Return the registry entries of the dynamic sensors with their key."""
+        registry = er.async_get(self.hass)
+        return [
+            (entity_entry, key)
+            for entity_entry in er.async_entries_for_config_entry(
+                registry, self.config_entry.entry_id
+            )
+            if (key := dynamic_sensor_key(entity_entry.unique_id)) is not None
+        ]
+
+    def _async_apply_dynamic_sensors(self, allowed: list[str]) -> None:
+        """Enable newly allowlisted dynamic sensors and disable removed ones.
+
+        Only keys whose allowlist membership changed are touched, so sensors
+        enabled or disabled by hand keep their state.
+        """
+        previous = set(self.config_entry.options.get(CONF_DYNAMIC_SENSORS, []))
+        added = set(allowed) - previous
+        removed = previous - set(allowed)
+        registry = er.async_get(self.hass)
+        for entity_entry, key in self._dynamic_sensor_entries():
+            if (
+                key in added
+                and entity_entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+            ):
+                registry.async_update_entity(entity_entry.entity_id, disabled_by=None)
+            elif key in removed and entity_entry.disabled_by is None:
+                registry.async_update_entity(
+                    entity_entry.entity_id,
+                    disabled_by=er.RegistryEntryDisabler.INTEGRATION,
+                )
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            self._async_apply_dynamic_sensors(
+                user_input.get(CONF_DYNAMIC_SENSORS, [])
+            )
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        # Every payload key seen so far has a (possibly disabled) entity.
+        dynamic_keys = sorted(
+            {key for _, key in self._dynamic_sensor_entries()}
+            | set(options.get(CONF_DYNAMIC_SENSORS, []))
+        )
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_MAX_CONCURRENCY,
+                    default=options.get(
+                        CONF_MAX_CONCURRENCY, DEFAULT_MAX_CONCURRENCY
+                    ),
+                ): selector(
+                    {"number": {"min": 1, "max": 64, "step": 1, "mode": "box"}}
+                ),
+                vol.Required(
+                    CONF_STATION_CONCURRENCY,
+                    default=options.get(
+                        CONF_STATION_CONCURRENCY, DEFAULT_STATION_CONCURRENCY
+                    ),
+                ): selector(
+                    {"number": {"min": 1, "max": 8, "step": 1, "mode": "box"}}
+                ),
+                vol.Required(
+                    CONF_DAY_GRAPH_STATISTICS,
+                    default=options.get(CONF_DAY_GRAPH_STATISTICS, False),
+                ): selector({"boolean": {}}),
+                vol.Required(
+                    CONF_GRAPH_POINTS,
+                    default=options.get(CONF_GRAPH_POINTS, DEFAULT_GRAPH_POINTS),
+                ): selector(
+                    {"number": {"min": 0, "max": 1440, "step": 1, "mode": "box"}}
+                ),
+                vol.Required(
+                    CONF_LIVE_INTERVAL,
+                    default=options.get(CONF_LIVE_INTERVAL, DEFAULT_LIVE_INTERVAL),
+                ): selector(
+                    {
+                        "number": {
+                            "min": 0,
+                            "max": 300,
+                            "step": 5,
+                            "mode": "box",
+                            "unit_of_measurement": "s",
+                        }
+                    }
+                ),
+                vol.Optional(
+                    CONF_DYNAMIC_SENSORS,
+                    default=options.get(CONF_DYNAMIC_SENSORS, []),
+                ): selector(
+                    {
+                        "select": {
+                            "options": dynamic_keys,
+                            "multiple": True,
+                            "custom_value": True,
+                        }
+                    }
+                ),
+                # Disabled sections are neither requested nor exposed; the
+                # entry reloads with the new options.
+                vol.Optional(
+                    CONF_DISABLED_SECTIONS,
+                    default=options.get(CONF_DISABLED_SECTIONS, []),
+                ): selector(
+                    {
+                        "select": {
+                            "options": list(OPTIONAL_SECTIONS),
+                            "multiple": True,
+                            "translation_key": CONF_DISABLED_SECTIONS,
+                        }
+                    }
+                ),
+            }
+        )
+
+        return self.async_show_form(step_id="init", data_schema=data_schema)
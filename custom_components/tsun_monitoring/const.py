@@ -1,4 +1,5 @@
 """Constants for the TSUN Monitoring integration."""
+from datetime import timedelta
 
 DOMAIN = "tsun_monitoring"
 
@@ -21,3 +22,173 @@ API_STATION_ALERT_LIST_URL = f"{API_BASE_URL}/station-s/station/alert/list"
 CLIENT_ID = "sdl_client"
 IDENTITY_TYPE = "2"
 SYSTEM = "TSUN"
+
+# Per-station detail sections fetched on top of the station list.
+SECTION_HISTORY_DAY = "history_day"
+SECTION_WEATHER_DAY = "weather_day"
+SECTION_MANAGE = "manage"
+SECTION_ENERGY_SAVED = "energy_saved"
+SECTION_CURRENT_FLOW = "current_flow"
+SECTION_SCENE = "scene"
+SECTION_ALERTS = "alerts"
+
+STATION_SECTIONS = (
+	SECTION_HISTORY_DAY,
+	SECTION_WEATHER_DAY,
+	SECTION_MANAGE,
+	SECTION_ENERGY_SAVED,
+	SECTION_CURRENT_FLOW,
+	SECTION_SCENE,
+	SECTION_ALERTS,
+)
+
+# Sections fetched by the coordinator of each station; alerts come in bulk
+# with the station list.
+STATION_DETAIL_SECTIONS = tuple(
+	section for section in STATION_SECTIONS if section != SECTION_ALERTS
+)
+
+# Sections that can be turned off in the options; the day history feeds the
+# Day Graph sensor and the statistics, so it is always fetched.
+OPTIONAL_SECTIONS = tuple(
+	section for section in STATION_SECTIONS if section != SECTION_HISTORY_DAY
+)
+
+SECTION_DESCRIPTIONS = {
+	SECTION_HISTORY_DAY: "day history",
+	SECTION_WEATHER_DAY: "day weather",
+	SECTION_MANAGE: "station manage",
+	SECTION_ENERGY_SAVED: "station energy saved",
+	SECTION_CURRENT_FLOW: "station current flow",
+	SECTION_SCENE: "station scene",
+	SECTION_ALERTS: "station alerts",
+}
+
+# Endpoints of the async client, for timeouts, retries and circuit breakers.
+# Detail endpoints are named after the section they fill.
+ENDPOINT_STATION_LIST = "station_list"
+ENDPOINT_STATUS_COUNT = "status_count"
+# Past day histories of the backfill service, kept apart from the live day
+# history so their failures do not open its circuit.
+ENDPOINT_HISTORY_BACKFILL = "history_backfill"
+API_ENDPOINTS = (
+	ENDPOINT_STATION_LIST,
+	ENDPOINT_STATUS_COUNT,
+	*STATION_SECTIONS,
+	ENDPOINT_HISTORY_BACKFILL,
+)
+
+# Request timeout per endpoint, in seconds.
+DEFAULT_REQUEST_TIMEOUT = 30
+ENDPOINT_TIMEOUTS = {
+	ENDPOINT_STATION_LIST: 20,
+	ENDPOINT_STATUS_COUNT: 10,
+	SECTION_HISTORY_DAY: 20,
+	SECTION_WEATHER_DAY: 10,
+	SECTION_MANAGE: 10,
+	SECTION_ENERGY_SAVED: 10,
+	SECTION_CURRENT_FLOW: 10,
+	SECTION_SCENE: 10,
+	SECTION_ALERTS: 20,
+	ENDPOINT_HISTORY_BACKFILL: 20,
+}
+
+# Retries of transient failures (5xx, 429, connection errors and timeouts),
+# with jittered exponential backoff between RETRY_BASE_DELAY and
+# RETRY_MAX_DELAY seconds.
+RETRY_ATTEMPTS = 2
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 10.0
+
+# An endpoint failing this many times in a row is skipped for the cooldown.
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_COOLDOWN = timedelta(minutes=5)
+
+# Requests per second allowed towards one API host, shared by every config
+# entry, with bursts of up to RATE_LIMIT_BURST requests.
+RATE_LIMIT_PER_SECOND = 10
+RATE_LIMIT_BURST = 20
+
+# Station item keys filled by each section.
+SECTION_KEYS = {
+	SECTION_HISTORY_DAY: (
+		"station_history_day",
+		"station_history_power_list",
+		"station_history_segment_day",
+	),
+	SECTION_WEATHER_DAY: ("weather_day",),
+	SECTION_MANAGE: ("station_manage",),
+	SECTION_ENERGY_SAVED: ("station_energy_saved",),
+	SECTION_CURRENT_FLOW: ("station_current_flow",),
+	SECTION_SCENE: ("station_scene",),
+	SECTION_ALERTS: ("station_alerts",),
+}
+
+# Minimum age before a cached section is fetched again. Sections with a zero
+# interval are refreshed on every coordinator update.
+SECTION_REFRESH_INTERVALS = {
+	SECTION_HISTORY_DAY: timedelta(0),
+	SECTION_CURRENT_FLOW: timedelta(0),
+	SECTION_ALERTS: timedelta(0),
+	SECTION_WEATHER_DAY: timedelta(hours=1),
+	SECTION_MANAGE: timedelta(hours=6),
+	SECTION_ENERGY_SAVED: timedelta(hours=6),
+	SECTION_SCENE: timedelta(hours=6),
+}
+
+# Sections holding data of the current day, never served past midnight.
+DAILY_SECTIONS = (SECTION_HISTORY_DAY, SECTION_WEATHER_DAY, SECTION_CURRENT_FLOW)
+
+UPDATE_INTERVAL = timedelta(minutes=5)
+
+# Refreshes of the config entries are offset from each other by this step.
+REFRESH_STAGGER = timedelta(seconds=30)
+
+# Live lane: the station list alone is polled at this interval to keep the
+# power sensors fresh between detailed refreshes.
+LIVE_UPDATE_INTERVAL = timedelta(seconds=30)
+LIVE_SENSOR_KEYS = ("generationPower", "batteryPower", "usePower", "batterySoc")
+
+# Adaptive polling: the coordinator interval follows the sun and live power.
+NIGHT_UPDATE_INTERVAL = timedelta(minutes=30)
+IDLE_UPDATE_INTERVAL = timedelta(minutes=15)
+FAST_UPDATE_INTERVAL = timedelta(minutes=2)
+# Below this absolute power (W) a station is considered idle.
+IDLE_POWER_THRESHOLD = 10
+# A power change larger than this share of the installed capacity between two
+# updates (or than the fallback in W without a capacity) tightens polling.
+FAST_CHANGE_RATIO = 0.15
+FAST_CHANGE_MIN_DELTA = 300
+
+# Day weather is shared by every station of a region.
+WEATHER_CACHE_TTL = SECTION_REFRESH_INTERVALS[SECTION_WEATHER_DAY]
+
+# History backfill: day requests in flight across every backfill, and days
+# fetched between two bulk imports into the statistics.
+SERVICE_BACKFILL_HISTORY = "backfill_history"
+BACKFILL_CONCURRENCY = 4
+BACKFILL_BATCH_DAYS = 30
+
+# Bulk alert retrieval: alerts kept per station and pagination bounds.
+ALERTS_PER_STATION = 50
+ALERTS_BULK_PAGE_SIZE = 200
+ALERTS_BULK_MAX_PAGES = 10
+
+CONF_MAX_CONCURRENCY = "max_concurrency"
+CONF_STATION_CONCURRENCY = "station_concurrency"
+CONF_DAY_GRAPH_STATISTICS = "day_graph_statistics"
+CONF_GRAPH_POINTS = "graph_points"
+CONF_LIVE_INTERVAL = "live_interval"
+CONF_DYNAMIC_SENSORS = "dynamic_sensors"
+CONF_DISABLED_SECTIONS = "disabled_sections"
+
+# Sensor type prefix of the dynamic sensors, one per remaining payload key;
+# their unique id is "<station id>_<prefix><key>".
+AUTO_SENSOR_PREFIX = "auto_"
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_STATION_CONCURRENCY = 4
+# Target number of power points exposed by the Day Graph sensor (0 keeps all).
+DEFAULT_GRAPH_POINTS = 144
+# Live lane interval in seconds (0 disables the live lane).
+DEFAULT_LIVE_INTERVAL = int(LIVE_UPDATE_INTERVAL.total_seconds())
@@ -0,0 +1,67 @@
+"""Diagnostics support for TSUN Monitoring."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .backfill import async_get_backfill
+from .const import DOMAIN
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME, "title", "unique_id"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data.coordinator
+    live_coordinator = entry_data.live_coordinator
+    backfill = await async_get_backfill(hass)
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "station_count": len(coordinator.data or []),
+        "last_update_success": coordinator.last_update_success,
+        "update_interval": str(coordinator.update_interval),
+        "live_lane": None
+        if live_coordinator is None
+        else {
+            "last_update_success": live_coordinator.last_update_success,
+            "update_interval": str(live_coordinator.update_interval),
+        },
+        "weather_cache": coordinator.api.weather_cache.stats(),
+        "rate_limiter": None
+        if coordinator.api.rate_limiter is None
+        else coordinator.api.rate_limiter.as_dict(),
+        "circuit_breakers": {
+            endpoint: breaker.as_dict()
+            for endpoint, breaker in coordinator.api.circuit_breakers.items()
+        },
+        "endpoint_metrics": {
+            endpoint: metrics.as_dict()
+            for endpoint, metrics in coordinator.api.endpoint_metrics.items()
+        },
+        "last_refresh": None
+        if coordinator.last_refresh is None
+        else coordinator.last_refresh.as_dict(),
+        "stations": {
+            station_id: {
+                "last_update_success": station.last_update_success,
+                "update_interval": str(station.update_interval),
+                "restored": station.restored,
+                "last_refresh": None
+                if station.last_refresh is None
+                else station.last_refresh.as_dict(),
+                "last_revalidation": None
+                if station.last_revalidation is None
+                else station.last_revalidation.as_dict(),
+            }
+            for station_id, station in coordinator.stations.items()
+        },
+        "backfill": backfill.as_dict(coordinator.stations),
+    }
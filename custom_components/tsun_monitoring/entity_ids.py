@@ -0,0 +1,10 @@
+"""Unique id scheme of the TSUN Monitoring entities."""
+from __future__ import annotations
+
+from .const import AUTO_SENSOR_PREFIX
+
+
+def dynamic_sensor_key(unique_id: str) -> str | None:
+    """Return the payload key of a dynamic sensor from its unique id."""
+    _, separator, key = unique_id.partition(f"_{AUTO_SENSOR_PREFIX}")
+    return key if separator else None
@@ -0,0 +1,64 @@
+"""Incremental buffers for station day history curves."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import date
+from typing import Any
+
+from .series import POINT_TIME_KEY, PowerSeries
+
+
+def _point_timestamp(point: dict[str, Any]) -> int | None:
+    """Return the timestamp of a power point, if it has a usable one."""
+    try:
+        return int(point[POINT_TIME_KEY])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class DayHistoryBuffer:
+    """Power points of one station for one local day.
+
+    The history endpoint always returns the whole day; the buffer only walks
+    the tail of each response back to the last timestamp it already holds and
+    appends what is newer to its columnar series, so the stored series is
+    never rebuilt.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        self.day: date | None = None
+        self.series = PowerSeries()
+
+    @property
+    def last_timestamp(self) -> int | None:
+        """Return the timestamp of the newest buffered point."""
+        return self.series.last_timestamp
+
+    def reset(self, day: date) -> None:
+        """Start a new day."""
+        self.day = day
+        self.series = PowerSeries()
+
+    def extend(self, points: Iterable[dict[str, Any]]) -> PowerSeries:
+        """Append the points newer than the last buffered one.
+
+        Points are expected in chronological order, as returned by the API.
+        Returns the buffered series, which callers must not mutate.
+        """
+        if not isinstance(points, list):
+            points = list(points)
+
+        last_timestamp = self.last_timestamp
+        new_points: list[dict[str, Any]] = []
+        for point in reversed(points):
+            timestamp = _point_timestamp(point)
+            if timestamp is None:
+                continue
+            if last_timestamp is not None and timestamp <= last_timestamp:
+                break
+            new_points.append(point)
+
+        new_points.reverse()
+        self.series.extend(new_points)
+        return self.series
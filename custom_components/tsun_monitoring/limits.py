@@ -0,0 +1,29 @@
+"""Request rate limiters shared by the TSUN Monitoring entries."""
+from __future__ import annotations
+
+from urllib.parse import urlsplit
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+
+from .const import DOMAIN, RATE_LIMIT_BURST, RATE_LIMIT_PER_SECOND
+from .resilience import TokenBucket
+
+DATA_RATE_LIMITERS = f"{DOMAIN}_rate_limiters"
+
+
+@singleton(DATA_RATE_LIMITERS)
+@callback
+def _async_get_rate_limiters(hass: HomeAssistant) -> dict[str, TokenBucket]:
+    """Return the request rate limiters shared by every entry, by API host."""
+    return {}
+
+
+@callback
+def async_get_rate_limiter(hass: HomeAssistant, base_url: str) -> TokenBucket:
+    """Return the rate limiter of an API host, creating it on first use."""
+    limiters = _async_get_rate_limiters(hass)
+    host = urlsplit(base_url).netloc
+    if (limiter := limiters.get(host)) is None:
+        limiter = limiters[host] = TokenBucket(RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST)
+    return limiter
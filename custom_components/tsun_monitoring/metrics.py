@@ -0,0 +1,169 @@
+"""Request and refresh metrics of the TSUN Monitoring API client."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import time
+
+# Upper bounds of the latency histogram buckets, in milliseconds. Slower
+# requests fall in a last, unbounded bucket.
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Refresh profile counting the requests of the current task, if any.
+_active_profile: ContextVar[RefreshProfile | None] = ContextVar(
+    "tsun_monitoring_refresh_profile", default=None
+)
+
+
+class EndpointMetrics:
+    """Request counters and latency histogram of one endpoint.
+
+    Every request sent counts once, retries and re-authentications included;
+    requests refused by an open circuit breaker are counted apart.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize empty metrics."""
+        self.name = name
+        self.requests = 0
+        self.failures = 0
+        self.retries = 0
+        self.reauths = 0
+        self.rejected = 0
+        self.response_bytes = 0
+        self.status_codes: Counter[str] = Counter()
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.latency_total_ms = 0.0
+        self.latency_min_ms = 0.0
+        self.latency_max_ms = 0.0
+        self.last_latency_ms: float | None = None
+
+    def record(self, latency: float, status: str, size: int = 0) -> None:
+        """Record a request that took ``latency`` seconds.
+
+        ``status`` is the HTTP status code, or the exception name when no
+        response came back.
+        """
+        latency_ms = latency * 1000
+        self.requests += 1
+        if not status.isdigit() or int(status) >= 400:
+            self.failures += 1
+        self.status_codes[status] += 1
+        self.response_bytes += size
+        self.latency_buckets[bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+        self.latency_total_ms += latency_ms
+        self.latency_min_ms = (
+            latency_ms if self.requests == 1 else min(self.latency_min_ms, latency_ms)
+        )
+        self.latency_max_ms = max(self.latency_max_ms, latency_ms)
+        self.last_latency_ms = latency_ms
+
+    def percentile(self, fraction: float) -> float | None:
+        """Return an estimate of a latency percentile, in milliseconds.
+
+        The estimate interpolates linearly within the histogram bucket holding
+        the percentile, whose limits are narrowed to the fastest and slowest
+        requests seen.
+        """
+        if not self.requests:
+            return None
+        rank = fraction * self.requests
+        seen = 0
+        lower = self.latency_min_ms
+        for index, count in enumerate(self.latency_buckets):
+            if count and seen + count >= rank:
+                upper = self.latency_max_ms
+                if index < len(LATENCY_BUCKETS_MS):
+                    upper = min(LATENCY_BUCKETS_MS[index], upper)
+                share = (rank - seen) / count
+                return round(lower + (max(upper, lower) - lower) * share, 1)
+            seen += count
+            if index < len(LATENCY_BUCKETS_MS):
+                lower = max(lower, LATENCY_BUCKETS_MS[index])
+        return round(self.latency_max_ms, 1)
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the metrics for diagnostics and sensor attributes."""
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "retries": self.retries,
+            "reauths": self.reauths,
+            "rejected": self.rejected,
+            "response_bytes": self.response_bytes,
+            "status_codes": dict(self.status_codes),
+            "latency_mean_ms": round(self.latency_total_ms / self.requests, 1)
+            if self.requests
+            else None,
+            "latency_p50_ms": self.percentile(0.5),
+            "latency_p95_ms": self.percentile(0.95),
+            "latency_min_ms": round(self.latency_min_ms, 1),
+            "latency_max_ms": round(self.latency_max_ms, 1),
+            "latency_histogram_ms": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(LATENCY_BUCKETS_MS, self.latency_buckets)
+                },
+                "inf": self.latency_buckets[-1],
+            },
+        }
+
+
+class RefreshProfile:
+    """Wall-clock duration of a refresh, broken down by phase.
+
+    Phases may overlap when they run concurrently, so their sum can differ
+    from the total.
+
+    Requests sent while the profile is active are counted in ``requests``,
+    also from tasks started meanwhile unless they activate a profile of their
+    own. Requests of other refreshes running at the same time are not.
+    """
+
+    def __init__(self) -> None:
+        """Start timing a refresh."""
+        self.started = time.perf_counter()
+        self.duration: float | None = None
+        self.phases: dict[str, float] = {}
+        self.requests = 0
+
+    @contextmanager
+    def activate(self) -> Iterator[None]:
+        """Count the requests sent in the current context into this profile."""
+        token = _active_profile.set(self)
+        try:
+            yield
+        finally:
+            _active_profile.reset(token)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a phase of the refresh, adding up repeated phases."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + (
+                time.perf_counter() - start
+            )
+
+    def finish(self) -> None:
+        """Stop timing, and counting requests."""
+        self.duration = time.perf_counter() - self.started
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the durations in seconds."""
+        return {
+            "duration": None if self.duration is None else round(self.duration, 3),
+            "requests": self.requests,
+            "phases": {name: round(value, 3) for name, value in self.phases.items()},
+        }
+
+
+def count_request() -> None:
+    """Count a request sent into the active refresh profile, if unfinished."""
+    if (profile := _active_profile.get()) is not None and profile.duration is None:
+        profile.requests += 1
@@ -0,0 +1,116 @@
+"""Adaptive polling interval for the TSUN Monitoring coordinator."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import Any
+
+from .const import (
+    FAST_CHANGE_MIN_DELTA,
+    FAST_CHANGE_RATIO,
+    FAST_UPDATE_INTERVAL,
+    IDLE_POWER_THRESHOLD,
+    IDLE_UPDATE_INTERVAL,
+    NIGHT_UPDATE_INTERVAL,
+    UPDATE_INTERVAL,
+)
+
+# Live station fields that drive the interval.
+POLLING_POWER_KEYS = ("generationPower", "batteryPower")
+
+
+def _power(station: dict[str, Any], key: str) -> float:
+    """Return a live power value of a station in W, 0 when missing."""
+    try:
+        return float(station.get(key) or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class AdaptivePollingPolicy:
+    """Pick the next update interval from the sun and the live station power.
+
+    - at night polling idles at ``NIGHT_UPDATE_INTERVAL``, or at
+      ``IDLE_UPDATE_INTERVAL`` while a battery is still charging/discharging
+    - by day, when no station produces or moves battery power, it slows down
+      to ``IDLE_UPDATE_INTERVAL``
+    - when a station power changed by more than ``FAST_CHANGE_RATIO`` of its
+      installed capacity since the last update, it tightens to
+      ``FAST_UPDATE_INTERVAL``
+    - otherwise ``UPDATE_INTERVAL`` is used
+
+    Night intervals are capped at the time left until sunrise so production is
+    picked up as soon as it starts.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the policy."""
+        self._last_power: dict[int, tuple[float, ...]] = {}
+
+    def next_interval(
+        self,
+        stations: Iterable[dict[str, Any]],
+        sun_up: bool,
+        until_sunrise: timedelta | None = None,
+    ) -> timedelta:
+        """Return the interval to wait before the next update."""
+        moving = False
+        fast = False
+        last_power: dict[int, tuple[float, ...]] = {}
+
+        for station in stations:
+            station_id = station.get("id")
+            power = tuple(_power(station, key) for key in POLLING_POWER_KEYS)
+            if any(abs(value) > IDLE_POWER_THRESHOLD for value in power):
+                moving = True
+            if station_id is None:
+                continue
+            last_power[station_id] = power
+            if (previous := self._last_power.get(station_id)) is None:
+                continue
+            capacity_w = _power(station, "installedCapacity") * 1000
+            threshold = (
+                capacity_w * FAST_CHANGE_RATIO if capacity_w else FAST_CHANGE_MIN_DELTA
+            )
+            if any(
+                abs(value - old) > threshold for value, old in zip(power, previous)
+            ):
+                fast = True
+
+        self._last_power = last_power
+
+        if fast:
+            return FAST_UPDATE_INTERVAL
+        if sun_up:
+            return UPDATE_INTERVAL if moving else IDLE_UPDATE_INTERVAL
+        interval = IDLE_UPDATE_INTERVAL if moving else NIGHT_UPDATE_INTERVAL
+        if until_sunrise is not None:
+            interval = max(min(interval, until_sunrise), UPDATE_INTERVAL)
+        return interval
+
+
+class RefreshStagger:
+    """Spread the refreshes of several config entries over time.
+
+    Each entry takes the lowest free slot and slot ``n`` is offset by ``n``
+    steps, wrapping around ``period``, so entries set up together do not
+    poll the API at the same moment.
+    """
+
+    def __init__(self, step: timedelta, period: timedelta) -> None:
+        """Initialize without any entry."""
+        self.step = step
+        self.period = period
+        self._slots: dict[str, int] = {}
+
+    def acquire(self, key: str) -> timedelta:
+        """Return the refresh offset of an entry, taking a slot if needed."""
+        if (slot := self._slots.get(key)) is None:
+            taken = set(self._slots.values())
+            slot = next(index for index in range(len(taken) + 1) if index not in taken)
+            self._slots[key] = slot
+        return (self.step * slot) % self.period
+
+    def release(self, key: str) -> None:
+        """Free the slot of an entry."""
+        self._slots.pop(key, None)
@@ -0,0 +1,176 @@
+"""Retries, circuit breakers and rate limiting of the TSUN Monitoring API client."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(aiohttp.ClientError):
+    """Raised instead of calling an endpoint whose circuit is open."""
+
+    def __init__(self, endpoint: str) -> None:
+        """Initialize the error for an endpoint."""
+        super().__init__(f"{endpoint} endpoint skipped after repeated failures")
+        self.endpoint = endpoint
+
+
+def is_transient_error(err: BaseException) -> bool:
+    """Return True for failures worth retrying: 5xx, 429 and transport errors."""
+    if isinstance(err, aiohttp.ClientResponseError):
+        return err.status == 429 or err.status >= 500
+    return isinstance(
+        err, (TimeoutError, aiohttp.ClientConnectionError, aiohttp.ClientPayloadError)
+    )
+
+
+def retry_after(err: BaseException) -> float | None:
+    """Return the delay requested by a ``Retry-After`` header, in seconds."""
+    headers = getattr(err, "headers", None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get("Retry-After")))
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(
+    attempt: int,
+    base: float,
+    cap: float,
+    requested: float | None = None,
+) -> float:
+    """Return the delay before retry ``attempt`` (0-based).
+
+    Uses exponential backoff with full jitter, so clients failing together do
+    not retry together. A server-requested delay is honored up to ``cap``.
+    """
+    if requested is not None:
+        return min(requested, cap)
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker of one endpoint.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests are refused for ``cooldown`` seconds. Then a single trial request
+    is let through: its success closes the circuit, its failure opens it for
+    another cooldown.
+    """
+
+    def __init__(self, name: str, failure_threshold: int, cooldown: float) -> None:
+        """Initialize a closed circuit."""
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: float | None = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        """Return the circuit state."""
+        if self.opened_at is None:
+            return CIRCUIT_CLOSED
+        if time.monotonic() - self.opened_at < self.cooldown:
+            return CIRCUIT_OPEN
+        return CIRCUIT_HALF_OPEN
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        state = self.state
+        if state == CIRCUIT_CLOSED:
+            return True
+        if state == CIRCUIT_HALF_OPEN and not self._trial_running:
+            self._trial_running = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        if self.opened_at is not None:
+            _LOGGER.info("The %s endpoint recovered", self.name)
+        self.failures = 0
+        self.opened_at = None
+        self._trial_running = False
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the circuit past the threshold."""
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                _LOGGER.warning(
+                    "Skipping the %s endpoint for %d s after %d failures",
+                    self.name,
+                    self.cooldown,
+                    self.failures,
+                )
+            self.opened_at = time.monotonic()
+        self._trial_running = False
+
+    def release(self) -> None:
+        """Give back a trial slot whose request ended without an outcome."""
+        self._trial_running = False
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the breaker state for diagnostics."""
+        return {"state": self.state, "consecutive_failures": self.failures}
+
+
+class TokenBucket:
+    """Token-bucket request rate limiter.
+
+    Holds up to ``burst`` tokens, refilled at ``rate`` tokens per second; each
+    request takes one token and waits for it when the bucket is empty. Waiters
+    are served in arrival order.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+        self.waits = 0
+        self.waited = 0.0
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Take a token, waiting for one if needed."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                delay = (1 - self._tokens) / self.rate
+                self.waits += 1
+                self.waited += delay
+                await asyncio.sleep(delay)
+                self._refill()
+            self._tokens -= 1
+
+    def as_dict(self) -> dict[str, object]:
+        """Return the limiter state for diagnostics."""
+        self._refill()
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": round(self._tokens, 2),
+            "waits": self.waits,
+            "waited": round(self.waited, 2),
+        }
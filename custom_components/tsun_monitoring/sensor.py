@@ -17,13 +17,30 @@ from homeassistant.const import (
     PERCENTAGE,
     UnitOfEnergy,
     UnitOfPower,
+    UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceEntryType
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import (
+    API_ENDPOINTS,
+    AUTO_SENSOR_PREFIX,
+    CONF_DAY_GRAPH_STATISTICS,
+    CONF_DYNAMIC_SENSORS,
+    DOMAIN,
+    LIVE_SENSOR_KEYS,
+    SECTION_ALERTS,
+    SECTION_CURRENT_FLOW,
+    SECTION_ENERGY_SAVED,
+    SECTION_SCENE,
+)
+from .series import PowerSeries
+from .statistics import station_statistic_ids
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -161,6 +178,45 @@ AUTO_EXCLUDED_KEYS = {
     "name",
 }
 
+PREDEFINED_KEYS = {
+    *(sensor["key"] for sensor in SENSOR_TYPES.values()),
+    *(sensor["key"] for sensor in TEXT_SENSOR_TYPES.values()),
+}
+
+# Item keys exposed by the Raw Data sensor, station payload first. The day
+# series are served by the websocket command instead.
+RAW_DATA_KEYS = (
+    "station",
+    "station_status_count",
+    "station_manage",
+    "station_energy_saved",
+    "station_current_flow",
+    "station_scene",
+    "station_alerts",
+    "station_history_day",
+    "station_history_segment_day",
+    "section_updated_at",
+)
+
+# Item keys the Day Graph attributes are built from, besides the day series.
+DAY_GRAPH_SOURCE_KEYS = (
+    "station_history_day",
+    "station_current_flow",
+    "station_energy_saved",
+    "station_status_count",
+    "station_scene",
+    "station_alerts",
+    "section_updated_at",
+)
+
+# Day Graph attributes filled by a section that can be disabled.
+DAY_GRAPH_SECTION_ATTRIBUTES = {
+    "current_flow": SECTION_CURRENT_FLOW,
+    "energy_saved": SECTION_ENERGY_SAVED,
+    "scene": SECTION_SCENE,
+    "alerts": SECTION_ALERTS,
+}
+
 
 def _prettify_key(key: str) -> str:
     """Convert API keys to readable sensor names."""
@@ -170,6 +226,8 @@ def _prettify_key(key: str) -> str:
 
 def _normalize_state_value(value: Any) -> Any:
     """Normalize API values to Home Assistant compatible sensor states."""
+    if isinstance(value, PowerSeries):
+        value = value.to_points()
     if isinstance(value, (dict, list)):
         return json.dumps(value, ensure_ascii=True, separators=(",", ":"))
     if value is None:
@@ -177,6 +235,19 @@ def _normalize_state_value(value: Any) -> Any:
     return value
 
 
+def _state_fingerprint(*parts: Any) -> int:
+    """Return a cheap hash of state parts, tolerant of nested dicts and lists."""
+    return hash(
+        json.dumps(
+            parts,
+            ensure_ascii=True,
+            separators=(",", ":"),
+            sort_keys=True,
+            default=str,
+        )
+    )
+
+
 def _collect_station_keys(data: list[dict[str, Any]]) -> set[str]:
     """Collect every key available in station payloads."""
     keys: set[str] = set()
@@ -187,91 +258,315 @@ def _collect_station_keys(data: list[dict[str, Any]]) -> set[str]:
     return keys
 
 
+def _endpoint_latency_unique_id(entry_id: str, endpoint: str) -> str:
+    """Return the unique id of the latency sensor of an endpoint."""
+    return f"{entry_id}_api_{endpoint}_latency"
+
+
+def _station_entities(
+    coordinator,
+    live_coordinator,
+    station_coordinator,
+    station_id: int,
+    station_name: str,
+    graph_statistics: bool,
+    disabled_sections: frozenset[str],
+) -> list[SensorEntity]:
+    """Return the predefined entities of a station."""
+    entities: list[SensorEntity] = []
+
+    # Add numeric sensors
+    for sensor_type, sensor_config in SENSOR_TYPES.items():
+        # Power and SOC sensors follow the live lane when it is enabled.
+        entities.append(
+            TsunMonitoringSensor(
+                live_coordinator
+                if sensor_config["key"] in LIVE_SENSOR_KEYS
+                else coordinator,
+                station_id,
+                station_name,
+                sensor_type,
+                sensor_config["name"],
+                sensor_config["key"],
+                sensor_config["unit"],
+                sensor_config["device_class"],
+                sensor_config["state_class"],
+            )
+        )
+
+    # Add text sensors
+    for sensor_type, sensor_config in TEXT_SENSOR_TYPES.items():
+        entities.append(
+            TsunMonitoringTextSensor(
+                coordinator,
+                station_id,
+                station_name,
+                sensor_type,
+                sensor_config["name"],
+                sensor_config["key"],
+            )
+        )
+
+    # Detail sections follow the coordinator of their station.
+    entities.append(
+        TsunMonitoringRawDataSensor(
+            station_coordinator,
+            station_id,
+            station_name,
+        )
+    )
+
+    entities.append(
+        TsunMonitoringDayGraphSensor(
+            station_coordinator,
+            station_id,
+            station_name,
+            summary_only=graph_statistics,
+            disabled_sections=disabled_sections,
+        )
+    )
+    return entities
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up TSUN Monitoring sensor based on a config entry."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]
-
-    entities = []
-    all_station_keys = _collect_station_keys(coordinator.data)
-    predefined_keys = {
-        *(sensor["key"] for sensor in SENSOR_TYPES.values()),
-        *(sensor["key"] for sensor in TEXT_SENSOR_TYPES.values()),
-    }
-
-    for item in coordinator.data:
-        station = item.get("station", {})
-        station_id = station.get("id")
-        station_name = station.get("name", "Unknown")
-
-        # Add numeric sensors
-        for sensor_type, sensor_config in SENSOR_TYPES.items():
-            entities.append(
-                TsunMonitoringSensor(
-                    coordinator,
-                    station_id,
-                    station_name,
-                    sensor_type,
-                    sensor_config["name"],
-                    sensor_config["key"],
-                    sensor_config["unit"],
-                    sensor_config["device_class"],
-                    sensor_config["state_class"],
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = entry_data.coordinator
+    live_coordinator = entry_data.live_coordinator or coordinator
+    graph_statistics = config_entry.options.get(CONF_DAY_GRAPH_STATISTICS, False)
+    disabled_sections = coordinator.api.disabled_sections
+
+    dynamic_sensors = set(config_entry.options.get(CONF_DYNAMIC_SENSORS, []))
+    known_stations: set[int] = set()
+    known_keys: set[str] = set()
+
+    @callback
+    def _async_remove_departed_stations() -> None:
+        """Remove the device and entities of stations that left the account.
+
+        Their entities are bound to the coordinator of the departed station,
+        so a station coming back gets new ones bound to its new coordinator.
+        """
+        device_registry = dr.async_get(hass)
+        for station_id in known_stations - set(coordinator.stations):
+            known_stations.discard(station_id)
+            if device := device_registry.async_get_device(
+                identifiers={(DOMAIN, station_id)}
+            ):
+                device_registry.async_update_device(
+                    device.id, remove_config_entry_id=config_entry.entry_id
                 )
-            )
 
-        # Add text sensors
-        for sensor_type, sensor_config in TEXT_SENSOR_TYPES.items():
-            entities.append(
-                TsunMonitoringTextSensor(
-                    coordinator,
-                    station_id,
-                    station_name,
-                    sensor_type,
-                    sensor_config["name"],
-                    sensor_config["key"],
+    @callback
+    def _async_discover() -> None:
+        """Create the entities of new stations and of new payload keys.
+
+        Dynamic sensors are disabled by default unless their key is in the
+        allowlist option.
+        """
+        _async_remove_departed_stations()
+        keys = {
+            key
+            for key in _collect_station_keys(coordinator.data or [])
+            if key not in PREDEFINED_KEYS and key not in AUTO_EXCLUDED_KEYS
+        }
+        new_keys = keys - known_keys
+        new_stations = set(coordinator.stations) - known_stations
+        if not new_keys and not new_stations:
+            return
+        if known_keys and new_keys:
+            _LOGGER.debug("New payload keys discovered: %s", sorted(new_keys))
+        known_keys.update(new_keys)
+        known_stations.update(new_stations)
+
+        entities = []
+        for station_id, station_coordinator in coordinator.stations.items():
+            station = station_coordinator.data.get("station", {})
+            station_name = station.get("name", "Unknown")
+            if station_id in new_stations:
+                entities.extend(
+                    _station_entities(
+                        coordinator,
+                        live_coordinator,
+                        station_coordinator,
+                        station_id,
+                        station_name,
+                        graph_statistics,
+                        disabled_sections,
+                    )
                 )
-            )
-
-        # Add dynamic sensors for every remaining field from the API payload.
-        for data_key in sorted(all_station_keys):
-            if data_key in predefined_keys or data_key in AUTO_EXCLUDED_KEYS:
-                continue
+                station_keys = keys
+            else:
+                station_keys = new_keys
 
-            entities.append(
+            # Add dynamic sensors for every remaining field from the API payload.
+            entities.extend(
                 TsunMonitoringDynamicSensor(
                     coordinator,
                     station_id,
                     station_name,
-                    f"auto_{data_key}",
+                    f"{AUTO_SENSOR_PREFIX}{data_key}",
                     _prettify_key(data_key),
                     data_key,
+                    enabled_default=data_key in dynamic_sensors,
                 )
+                for data_key in sorted(station_keys)
             )
 
-        entities.append(
-            TsunMonitoringRawDataSensor(
-                coordinator,
-                station_id,
-                station_name,
-            )
-        )
+        async_add_entities(entities)
+
+    _async_discover()
+    # Stations and payload keys that show up later get their entities without
+    # reloading the entry.
+    config_entry.async_on_unload(coordinator.async_add_listener(_async_discover))
+
+    # Latency sensors of disabled endpoints go away with them.
+    registry = er.async_get(hass)
+    for endpoint in disabled_sections:
+        if entity_id := registry.async_get_entity_id(
+            "sensor",
+            DOMAIN,
+            _endpoint_latency_unique_id(config_entry.entry_id, endpoint),
+        ):
+            registry.async_remove(entity_id)
+
+    # Diagnostic sensors of the API client, on a service device of the entry.
+    async_add_entities(
+        [
+            TsunMonitoringRefreshSensor(coordinator, config_entry.entry_id),
+            TsunMonitoringRequestsSensor(coordinator, config_entry.entry_id),
+            *(
+                TsunMonitoringEndpointLatencySensor(
+                    coordinator, config_entry.entry_id, endpoint
+                )
+                for endpoint in API_ENDPOINTS
+                if endpoint not in disabled_sections
+            ),
+        ]
+    )
 
-        entities.append(
-            TsunMonitoringDayGraphSensor(
-                coordinator,
-                station_id,
-                station_name,
-            )
+
+class TsunMonitoringStationEntity(CoordinatorEntity):
+    """Base class for entities bound to one TSUN station.
+
+    State is only written when the availability, value or attributes of the
+    entity changed since the last write, so static sensors do not produce a
+    state write and recorder row on every coordinator update. Attributes are
+    built once per change and served from that build by the write.
+
+    Entities with small attributes fingerprint the state they would publish.
+    Entities rendering large item values return them from
+    ``_fingerprint_sources`` instead: each value is hashed only when the item
+    holds a new object for it, which is how coordinators replace data.
+
+    Subclasses provide their attributes through ``_station_attributes`` so
+    entities served from the warm-start snapshot all carry the same
+    ``restored`` and ``data_as_of`` markers.
+    """
+
+    def __init__(self, coordinator, station_id: int, station_name: str) -> None:
+        """Initialize the station entity."""
+        super().__init__(coordinator)
+        self._station_id = station_id
+        self._station_name = station_name
+        self._last_fingerprint: int | None = None
+        self._attributes: dict[str, Any] | None = None
+        self._source_hashes: dict[str, tuple[Any, int]] = {}
+
+    def _fingerprint_sources(self) -> dict[str, Any] | None:
+        """Return the item values the state is built from, by name.
+
+        None fingerprints the built state instead.
+        """
+        return None
+
+    def _sources_fingerprint(self, sources: dict[str, Any]) -> int:
+        """Return the fingerprint of source values, reusing unchanged hashes."""
+        hashes = []
+        for name, value in sources.items():
+            cached = self._source_hashes.get(name)
+            if cached is None or cached[0] is not value:
+                cached = self._source_hashes[name] = (value, _state_fingerprint(value))
+            hashes.append(cached[1])
+        return hash(
+            (self.available, self.coordinator.restored_at, self.native_value, *hashes)
         )
 
-    async_add_entities(entities)
+    @callback
+    def _async_update_attributes(self) -> bool:
+        """Rebuild the attributes if the data changed, and return whether it did."""
+        if (sources := self._fingerprint_sources()) is None:
+            attrs = self._build_attributes()
+            fingerprint = _state_fingerprint(self.available, self.native_value, attrs)
+        else:
+            attrs = None
+            fingerprint = self._sources_fingerprint(sources)
+        if fingerprint == self._last_fingerprint:
+            return False
+        self._last_fingerprint = fingerprint
+        self._attributes = self._build_attributes() if sources is not None else attrs
+        return True
+
+    async def async_added_to_hass(self) -> None:
+        """Build the attributes of the initial state."""
+        await super().async_added_to_hass()
+        self._async_update_attributes()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the entity data actually changed."""
+        if self._async_update_attributes():
+            self.async_write_ha_state()
+
+    def _station_attributes(self) -> dict[str, Any]:
+        """Return the attributes built from the station item."""
+        return {}
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the attributes built for the current state."""
+        return self._attributes
+
+    def _build_attributes(self) -> dict[str, Any] | None:
+        """Return the station attributes, flagged while data is restored."""
+        attrs = self._station_attributes()
+        if self.coordinator.restored:
+            attrs = {
+                **attrs,
+                "restored": True,
+                "data_as_of": self.coordinator.restored_at.isoformat(),
+            }
+        return attrs or None
+
+    @property
+    def device_info(self) -> dict[str, Any]:
+        """Return device information."""
+        return {
+            "identifiers": {(DOMAIN, self._station_id)},
+            "name": self._station_name,
+            "manufacturer": "TSUN",
+            "model": "Solar Station",
+        }
 
-class TsunMonitoringSensor(CoordinatorEntity, SensorEntity):
+    @property
+    def _station_item(self) -> dict[str, Any] | None:
+        """Return the coordinator item of this station."""
+        return self.coordinator.get_station_item(self._station_id)
+
+    @property
+    def _station(self) -> dict[str, Any] | None:
+        """Return the station payload of this station."""
+        item = self._station_item
+        if item is None:
+            return None
+        return item.get("station", {})
+
+
+class TsunMonitoringSensor(TsunMonitoringStationEntity, SensorEntity):
     """Representation of a TSUN Monitoring Sensor."""
 
     def __init__(
@@ -287,9 +582,7 @@ class TsunMonitoringSensor(CoordinatorEntity, SensorEntity):
         state_class: SensorStateClass | None,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._station_id = station_id
-        self._station_name = station_name
+        super().__init__(coordinator, station_id, station_name)
         self._sensor_type = sensor_type
         self._data_key = data_key
         self._attr_name = f"{station_name} {sensor_name}"
@@ -298,56 +591,44 @@ class TsunMonitoringSensor(CoordinatorEntity, SensorEntity):
         self._attr_device_class = device_class
         self._attr_state_class = state_class
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._station_id)},
-            "name": self._station_name,
-            "manufacturer": "TSUN",
-            "model": "Solar Station",
-        }
-
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        for item in self.coordinator.data:
-            station = item.get("station", {})
-            if station.get("id") == self._station_id:
-                value = station.get(self._data_key)
-                return value if value is not None else 0
-        return None
+        station = self._station
+        if station is None:
+            return None
+        value = station.get(self._data_key)
+        return value if value is not None else 0
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def _station_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        for item in self.coordinator.data:
-            station = item.get("station", {})
-            if station.get("id") == self._station_id:
-                attrs = {
-                    "location": station.get("locationAddress"),
-                    "power_type": station.get("powerType"),
-                    "geography_type": station.get("geographyType"),
-                    "operation_type": station.get("operationType"),
-                    "power_system_type": station.get("powerSystemType"),
-                    "last_update": station.get("lastUpdateTime"),
-                    "operating": station.get("operating"),
-                }
-                
-                if station.get("lastUpdateTime"):
-                    try:
-                        timestamp = station["lastUpdateTime"]
-                        attrs["last_update_formatted"] = datetime.fromtimestamp(
-                            timestamp
-                        ).isoformat()
-                    except (ValueError, TypeError):
-                        pass
-                        
-                return {k: v for k, v in attrs.items() if v is not None}
-        return {}
+        station = self._station
+        if station is None:
+            return {}
+
+        attrs = {
+            "location": station.get("locationAddress"),
+            "power_type": station.get("powerType"),
+            "geography_type": station.get("geographyType"),
+            "operation_type": station.get("operationType"),
+            "power_system_type": station.get("powerSystemType"),
+            "last_update": station.get("lastUpdateTime"),
+            "operating": station.get("operating"),
+        }
+
+        if station.get("lastUpdateTime"):
+            try:
+                timestamp = station["lastUpdateTime"]
+                attrs["last_update_formatted"] = datetime.fromtimestamp(
+                    timestamp
+                ).isoformat()
+            except (ValueError, TypeError):
+                pass
 
+        return {k: v for k, v in attrs.items() if v is not None}
 
-class TsunMonitoringTextSensor(CoordinatorEntity, SensorEntity):
+
+class TsunMonitoringTextSensor(TsunMonitoringStationEntity, SensorEntity):
     """Representation of a TSUN Monitoring Text Sensor."""
 
     def __init__(
@@ -360,36 +641,27 @@ class TsunMonitoringTextSensor(CoordinatorEntity, SensorEntity):
         data_key: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._station_id = station_id
-        self._station_name = station_name
+        super().__init__(coordinator, station_id, station_name)
         self._sensor_type = sensor_type
         self._data_key = data_key
         self._attr_name = f"{station_name} {sensor_name}"
         self._attr_unique_id = f"{station_id}_{sensor_type}"
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._station_id)},
-            "name": self._station_name,
-            "manufacturer": "TSUN",
-            "model": "Solar Station",
-        }
-
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        for item in self.coordinator.data:
-            station = item.get("station", {})
-            if station.get("id") == self._station_id:
-                return station.get(self._data_key, "Unknown")
-        return None
+        station = self._station
+        if station is None:
+            return None
+        return station.get(self._data_key, "Unknown")
+
 
+class TsunMonitoringDynamicSensor(TsunMonitoringStationEntity, SensorEntity):
+    """Representation of a dynamic TSUN Monitoring Sensor.
 
-class TsunMonitoringDynamicSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a dynamic TSUN Monitoring Sensor."""
+    Disabled by default in the entity registry unless its key is allowlisted
+    in the options.
+    """
 
     def __init__(
         self,
@@ -399,157 +671,290 @@ class TsunMonitoringDynamicSensor(CoordinatorEntity, SensorEntity):
         sensor_type: str,
         sensor_name: str,
         data_key: str,
+        enabled_default: bool = False,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._station_id = station_id
-        self._station_name = station_name
+        super().__init__(coordinator, station_id, station_name)
         self._sensor_type = sensor_type
         self._data_key = data_key
         self._attr_name = f"{station_name} {sensor_name}"
         self._attr_unique_id = f"{station_id}_{sensor_type}"
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._station_id)},
-            "name": self._station_name,
-            "manufacturer": "TSUN",
-            "model": "Solar Station",
-        }
+        self._attr_entity_registry_enabled_default = enabled_default
 
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        for item in self.coordinator.data:
-            station = item.get("station", {})
-            if station.get("id") == self._station_id:
-                return _normalize_state_value(station.get(self._data_key))
-        return None
+        station = self._station
+        if station is None:
+            return None
+        return _normalize_state_value(station.get(self._data_key))
 
 
-class TsunMonitoringRawDataSensor(CoordinatorEntity, SensorEntity):
+class TsunMonitoringRawDataSensor(TsunMonitoringStationEntity, SensorEntity):
     """Representation of a station raw payload sensor."""
 
     def __init__(self, coordinator, station_id: int, station_name: str) -> None:
         """Initialize the raw data sensor."""
-        super().__init__(coordinator)
-        self._station_id = station_id
-        self._station_name = station_name
+        super().__init__(coordinator, station_id, station_name)
         self._attr_name = f"{station_name} Raw Data"
         self._attr_unique_id = f"{station_id}_raw_data"
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_icon = "mdi:database"
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        return {
-            "identifiers": {(DOMAIN, self._station_id)},
-            "name": self._station_name,
-            "manufacturer": "TSUN",
-            "model": "Solar Station",
-        }
-
     @property
     def native_value(self):
         """Return a compact primary state for the raw data sensor."""
-        for item in self.coordinator.data:
-            station = item.get("station", {})
-            if station.get("id") == self._station_id:
-                return station.get("operating", "unknown")
-        return None
+        station = self._station
+        if station is None:
+            return None
+        return station.get("operating", "unknown")
+
+    def _fingerprint_sources(self) -> dict[str, Any] | None:
+        """Return the station payload and the sections exposed."""
+        item = self._station_item
+        if item is None:
+            return {}
+        return {key: item.get(key) for key in RAW_DATA_KEYS}
+
+    def _station_attributes(self) -> dict[str, Any]:
+        """Expose the station payload as sensor attributes.
+
+        The day power and weather series are left out: they are served by the
+        ``tsun_monitoring/day_series`` websocket command.
+        """
+        item = self._station_item
+        if item is None:
+            return {}
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Expose the full station payload as sensor attributes."""
-        for item in self.coordinator.data:
-            station = item.get("station", {})
-            if station.get("id") == self._station_id:
-                attrs = {
-                    key: _normalize_state_value(value)
-                    for key, value in station.items()
-                    if value is not None
-                }
-
-                extra_sections = {
-                    "station_status_count": item.get("station_status_count"),
-                    "station_manage": item.get("station_manage"),
-                    "station_energy_saved": item.get("station_energy_saved"),
-                    "station_current_flow": item.get("station_current_flow"),
-                    "station_scene": item.get("station_scene"),
-                    "station_alerts": item.get("station_alerts"),
-                    "station_history_day": item.get("station_history_day"),
-                    "station_history_segment_day": item.get("station_history_segment_day"),
-                    "station_history_power_list": item.get("station_history_power_list"),
-                    "weather_day": item.get("weather_day"),
-                }
-
-                for key, value in extra_sections.items():
-                    if value is not None:
-                        attrs[key] = _normalize_state_value(value)
-
-                return attrs
-        return {}
+        station = item.get("station", {})
+        attrs = {
+            key: _normalize_state_value(value)
+            for key, value in station.items()
+            if value is not None
+        }
 
+        for key in RAW_DATA_KEYS[1:]:
+            if (value := item.get(key)) is not None:
+                attrs[key] = _normalize_state_value(value)
 
-class TsunMonitoringDayGraphSensor(CoordinatorEntity, SensorEntity):
-    """Expose station day chart data from official API endpoints."""
+        return attrs
 
-    def __init__(self, coordinator, station_id: int, station_name: str) -> None:
+
+class TsunMonitoringDayGraphSensor(TsunMonitoringStationEntity, SensorEntity):
+    """Expose station day chart data from official API endpoints.
+
+    The day series themselves (power, weather and segments) are served on
+    demand by the ``tsun_monitoring/day_series`` websocket command, so they
+    stay out of the state machine. With ``summary_only`` the curves are also
+    imported as long-term statistics, and the attributes keep only the day
+    summary and statistic ids. Attributes of ``disabled_sections`` are left
+    out.
+    """
+
+    def __init__(
+        self,
+        coordinator,
+        station_id: int,
+        station_name: str,
+        summary_only: bool = False,
+        disabled_sections: frozenset[str] = frozenset(),
+    ) -> None:
         """Initialize the day graph sensor."""
-        super().__init__(coordinator)
-        self._station_id = station_id
-        self._station_name = station_name
+        super().__init__(coordinator, station_id, station_name)
+        self._summary_only = summary_only
+        self._disabled_sections = disabled_sections
         self._attr_name = f"{station_name} Day Graph"
         self._attr_unique_id = f"{station_id}_day_graph"
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_icon = "mdi:chart-timeline-variant"
 
+    @property
+    def native_value(self):
+        """Return point count to quickly verify graph payload availability."""
+        item = self._station_item
+        if item is None:
+            return 0
+        points = item.get("station_history_power_list", [])
+        return len(points)
+
+    def _fingerprint_sources(self) -> dict[str, Any] | None:
+        """Return the item values the attributes are built from.
+
+        The day series grows in place, so it is represented by its last point;
+        its length is the state.
+        """
+        item = self._station_item
+        if item is None:
+            return {}
+        power_series = item.get("station_history_power_list") or []
+        return {
+            "last_point": power_series[-1] if power_series else None,
+            **{key: item.get(key) for key in DAY_GRAPH_SOURCE_KEYS},
+        }
+
+    def _station_attributes(self) -> dict[str, Any]:
+        """Return the daily summary, last power point and station blocks."""
+        item = self._station_item
+        if item is None:
+            return {}
+
+        power_series = item.get("station_history_power_list") or []
+        day_summary = item.get("station_history_day") or {}
+        last_point = power_series[-1] if power_series else None
+
+        if self._summary_only:
+            return {
+                "day_summary": day_summary,
+                "last_point": last_point,
+                "statistic_ids": station_statistic_ids(self._station_id),
+                "section_updated_at": item.get("section_updated_at") or {},
+            }
+
+        attrs = {
+            "day_summary": day_summary,
+            "last_point": last_point,
+            "current_flow": item.get("station_current_flow") or {},
+            "energy_saved": item.get("station_energy_saved") or {},
+            "status_count": item.get("station_status_count") or {},
+            "scene": item.get("station_scene"),
+            "alerts": item.get("station_alerts") or {},
+            "section_updated_at": item.get("section_updated_at") or {},
+        }
+        return {
+            k: v
+            for k, v in attrs.items()
+            if v is not None
+            and DAY_GRAPH_SECTION_ATTRIBUTES.get(k) not in self._disabled_sections
+        }
+
+
+class TsunMonitoringApiEntity(CoordinatorEntity):
+    """Base class for diagnostic entities of the API client of an entry."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator, entry_id: str) -> None:
+        """Initialize the API entity."""
+        super().__init__(coordinator)
+        self._entry_id = entry_id
+
     @property
     def device_info(self) -> dict[str, Any]:
         """Return device information."""
         return {
-            "identifiers": {(DOMAIN, self._station_id)},
-            "name": self._station_name,
+            "identifiers": {(DOMAIN, f"{self._entry_id}_api")},
+            "name": "TSUN Monitoring API",
             "manufacturer": "TSUN",
-            "model": "Solar Station",
+            "model": "Talent Monitoring API",
+            "entry_type": DeviceEntryType.SERVICE,
         }
 
+
+class TsunMonitoringRefreshSensor(TsunMonitoringApiEntity, SensorEntity):
+    """Duration of the last station list refresh, with its phases.
+
+    The slowest last refresh of a station coordinator is added so a station
+    holding up its detail sections stands out.
+    """
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_suggested_display_precision = 2
+    _attr_icon = "mdi:timer-outline"
+
+    def __init__(self, coordinator, entry_id: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry_id)
+        self._attr_name = "API Refresh Duration"
+        self._attr_unique_id = f"{entry_id}_api_refresh_duration"
+
     @property
     def native_value(self):
-        """Return point count to quickly verify graph payload availability."""
-        for item in self.coordinator.data:
-            station = item.get("station", {})
-            if station.get("id") == self._station_id:
-                points = item.get("station_history_power_list", [])
-                return len(points)
-        return 0
+        """Return the duration of the last refresh, in seconds."""
+        profile = self.coordinator.last_refresh
+        return None if profile is None else profile.as_dict()["duration"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the phases and requests of the last refresh."""
+        profile = self.coordinator.last_refresh
+        if profile is None:
+            return None
+        refresh = profile.as_dict()
+        attrs = {"requests": refresh["requests"], "phases": refresh["phases"]}
+        station_refreshes = {
+            station_id: station.last_refresh
+            for station_id, station in self.coordinator.stations.items()
+            if station.last_refresh is not None
+            and station.last_refresh.duration is not None
+        }
+        if station_refreshes:
+            station_id = max(
+                station_refreshes,
+                key=lambda station_id: station_refreshes[station_id].duration,
+            )
+            attrs["slowest_station"] = {
+                "station_id": station_id,
+                **station_refreshes[station_id].as_dict(),
+            }
+        return attrs
+
+
+class TsunMonitoringRequestsSensor(TsunMonitoringApiEntity, SensorEntity):
+    """Total number of requests sent to the API, with the failure counters."""
+
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_icon = "mdi:swap-vertical"
+
+    def __init__(self, coordinator, entry_id: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry_id)
+        self._attr_name = "API Requests"
+        self._attr_unique_id = f"{entry_id}_api_requests"
+
+    @property
+    def native_value(self):
+        """Return the number of requests sent since startup."""
+        return self.coordinator.api.request_count
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
-        """Return daily summary, power points and weather points."""
-        for item in self.coordinator.data:
-            station = item.get("station", {})
-            if station.get("id") == self._station_id:
-                power_points = item.get("station_history_power_list", [])
-                weather_points = item.get("weather_day", [])
-                day_summary = item.get("station_history_day") or {}
-                segment_day = item.get("station_history_segment_day") or {}
-
-                attrs = {
-                    "day_summary": day_summary,
-                    "power_points": power_points,
-                    "weather_points": weather_points,
-                    "segment_day": segment_day,
-                    "last_point": power_points[-1] if power_points else None,
-                    "current_flow": item.get("station_current_flow") or {},
-                    "energy_saved": item.get("station_energy_saved") or {},
-                    "status_count": item.get("station_status_count") or {},
-                    "scene": item.get("station_scene"),
-                    "alerts": item.get("station_alerts") or {},
-                }
-                return {k: v for k, v in attrs.items() if v is not None}
-        return {}
+        """Return the counters summed over every endpoint."""
+        metrics = self.coordinator.api.endpoint_metrics.values()
+        return {
+            key: sum(getattr(endpoint, key) for endpoint in metrics)
+            for key in ("failures", "retries", "reauths", "rejected", "response_bytes")
+        }
+
+
+class TsunMonitoringEndpointLatencySensor(TsunMonitoringApiEntity, SensorEntity):
+    """95th percentile latency of one endpoint, with its request metrics.
+
+    Disabled by default: one sensor exists per endpoint.
+    """
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_entity_registry_enabled_default = False
+    _attr_icon = "mdi:timer-sand"
+
+    def __init__(self, coordinator, entry_id: str, endpoint: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, entry_id)
+        self._endpoint = endpoint
+        self._attr_name = f"API {_prettify_key(endpoint)} Latency"
+        self._attr_unique_id = _endpoint_latency_unique_id(entry_id, endpoint)
+
+    @property
+    def native_value(self):
+        """Return the 95th percentile latency, in milliseconds."""
+        metrics = self.coordinator.api.endpoint_metrics.get(self._endpoint)
+        return None if metrics is None else metrics.percentile(0.95)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the request metrics of the endpoint."""
+        metrics = self.coordinator.api.endpoint_metrics.get(self._endpoint)
+        return None if metrics is None else metrics.as_dict()
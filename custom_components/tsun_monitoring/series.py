@@ -0,0 +1,242 @@
+"""Compact columnar storage and downsampling for station power points."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+import math
+from typing import Any, overload
+
+POINT_TIME_KEY = "dateTime"
+
+DOWNSAMPLE_LTTB = "lttb"
+DOWNSAMPLE_MINMAX = "minmax"
+
+
+def _is_number(value: Any) -> bool:
+    """Return True for int/float values, excluding booleans."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class PowerSeries(Sequence[dict[str, Any]]):
+    """Day power points stored as typed columns.
+
+    Timestamps live in an ``array('q')`` and every numeric point field (power
+    values, SOC, ...) in its own ``array('d')``, with NaN marking a missing
+    value. Indexing and iteration rebuild point dicts on demand, so code that
+    treats the series as a list of points keeps working.
+    """
+
+    __slots__ = ("timestamps", "_columns")
+
+    def __init__(self, points: Iterable[dict[str, Any]] = ()) -> None:
+        """Initialize the series from optional points."""
+        self.timestamps = array("q")
+        self._columns: dict[str, array] = {}
+        self.extend(points)
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        return len(self.timestamps)
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index):
+        """Return one point, or a list of points for a slice."""
+        if isinstance(index, slice):
+            return self.to_points(range(*index.indices(len(self))))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PowerSeries index out of range")
+        return self._point(index)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        """Iterate over rebuilt point dicts."""
+        for index in range(len(self)):
+            yield self._point(index)
+
+    @property
+    def fields(self) -> list[str]:
+        """Return the names of the stored value columns."""
+        return list(self._columns)
+
+    @property
+    def last_timestamp(self) -> int | None:
+        """Return the timestamp of the newest point."""
+        return self.timestamps[-1] if self.timestamps else None
+
+    def column(self, field: str) -> array:
+        """Return the value column of a field (NaN when missing)."""
+        if field in self._columns:
+            return self._columns[field]
+        return array("d", [math.nan]) * len(self)
+
+    def append(self, point: dict[str, Any]) -> None:
+        """Append one point; points without a numeric timestamp are skipped."""
+        try:
+            timestamp = int(point[POINT_TIME_KEY])
+        except (KeyError, TypeError, ValueError):
+            return
+
+        size = len(self.timestamps)
+        self.timestamps.append(timestamp)
+        for field, value in point.items():
+            if field == POINT_TIME_KEY or not _is_number(value):
+                continue
+            column = self._columns.get(field)
+            if column is None:
+                column = self._columns[field] = array("d", [math.nan]) * size
+            column.append(float(value))
+        for column in self._columns.values():
+            if len(column) == size:
+                column.append(math.nan)
+
+    def extend(self, points: Iterable[dict[str, Any]]) -> None:
+        """Append several points."""
+        for point in points:
+            self.append(point)
+
+    def _point(self, index: int) -> dict[str, Any]:
+        """Rebuild the point dict at an index."""
+        point: dict[str, Any] = {POINT_TIME_KEY: self.timestamps[index]}
+        for field, column in self._columns.items():
+            value = column[index]
+            if not math.isnan(value):
+                point[field] = int(value) if value.is_integer() else value
+        return point
+
+    def to_points(self, indices: Iterable[int] | None = None) -> list[dict[str, Any]]:
+        """Return point dicts for the given indices, or for every point."""
+        if indices is None:
+            indices = range(len(self))
+        return [self._point(index) for index in indices]
+
+    def index_range(self, start: float | None = None, end: float | None = None) -> range:
+        """Return the indices of points whose timestamp is within [start, end]."""
+        first = 0 if start is None else bisect_left(self.timestamps, start)
+        last = len(self) if end is None else bisect_right(self.timestamps, end)
+        return range(first, max(first, last))
+
+    def downsample(
+        self,
+        target: int,
+        method: str = DOWNSAMPLE_LTTB,
+        indices: range | None = None,
+    ) -> list[int]:
+        """Return at most about ``target`` indices that keep the curve shape.
+
+        ``lttb`` runs Largest-Triangle-Three-Buckets over all value columns at
+        once, each normalized to its own range so power and SOC weigh alike.
+        ``minmax`` keeps, per bucket, the extreme points of every column.
+        """
+        if indices is None:
+            indices = range(len(self))
+        if target <= 0 or len(indices) <= target:
+            return list(indices)
+        if method == DOWNSAMPLE_MINMAX:
+            return self._minmax_indices(indices, target)
+        return self._lttb_indices(indices, target)
+
+    def points(
+        self,
+        target: int | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        method: str = DOWNSAMPLE_LTTB,
+    ) -> list[dict[str, Any]]:
+        """Return point dicts, optionally time-filtered and downsampled."""
+        indices = self.index_range(start, end)
+        if target:
+            return self.to_points(self.downsample(target, method, indices))
+        return self.to_points(indices)
+
+    def _normalized_columns(self, indices: range) -> list[list[float]]:
+        """Return the value columns over ``indices`` scaled to [0, 1]."""
+        normalized = []
+        for column in self._columns.values():
+            values = [column[index] for index in indices]
+            present = [value for value in values if not math.isnan(value)]
+            if not present:
+                continue
+            low = min(present)
+            span = (max(present) - low) or 1.0
+            normalized.append(
+                [0.0 if math.isnan(value) else (value - low) / span for value in values]
+            )
+        return normalized
+
+    def _lttb_indices(self, indices: range, target: int) -> list[int]:
+        """Largest-Triangle-Three-Buckets selection over ``indices``."""
+        size = len(indices)
+        if target < 3:
+            return [indices[0], indices[-1]][:target]
+
+        xs = [float(self.timestamps[index]) for index in indices]
+        columns = self._normalized_columns(indices)
+        selected = [0]
+        bucket_size = (size - 2) / (target - 2)
+        previous = 0
+
+        for bucket in range(target - 2):
+            bucket_start = int(bucket * bucket_size) + 1
+            bucket_end = int((bucket + 1) * bucket_size) + 1
+            next_start = bucket_end
+            next_end = min(int((bucket + 2) * bucket_size) + 1, size)
+            if next_start >= size - 1:
+                next_start, next_end = size - 1, size
+
+            span = next_end - next_start
+            avg_x = sum(xs[next_start:next_end]) / span
+            avg_ys = [sum(column[next_start:next_end]) / span for column in columns]
+
+            best_index = bucket_start
+            best_area = -1.0
+            for candidate in range(bucket_start, bucket_end):
+                area = 0.0
+                for column, avg_y in zip(columns, avg_ys):
+                    area += abs(
+                        (xs[previous] - avg_x) * (column[candidate] - column[previous])
+                        - (xs[previous] - xs[candidate]) * (avg_y - column[previous])
+                    )
+                if area > best_area:
+                    best_area = area
+                    best_index = candidate
+
+            selected.append(best_index)
+            previous = best_index
+
+        selected.append(size - 1)
+        return [indices[position] for position in selected]
+
+    def _minmax_indices(self, indices: range, target: int) -> list[int]:
+        """Per-bucket min/max selection over ``indices``."""
+        size = len(indices)
+        columns = [
+            column for column in self._columns.values() if not all(map(math.isnan, column))
+        ]
+        buckets = max(1, target // max(2, 2 * len(columns)))
+        bucket_size = size / buckets
+        selected = {0, size - 1}
+
+        for bucket in range(buckets):
+            bucket_start = int(bucket * bucket_size)
+            bucket_end = min(int((bucket + 1) * bucket_size), size)
+            for column in columns:
+                low_index = high_index = None
+                for position in range(bucket_start, bucket_end):
+                    value = column[indices[position]]
+                    if math.isnan(value):
+                        continue
+                    if low_index is None or value < column[indices[low_index]]:
+                        low_index = position
+                    if high_index is None or value > column[indices[high_index]]:
+                        high_index = position
+                if low_index is not None:
+                    selected.update((low_index, high_index))
+
+        return [indices[position] for position in sorted(selected)]
@@ -0,0 +1,238 @@
+"""Long-term statistics import for TSUN Monitoring day curves."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import PERCENTAGE, UnitOfPower, UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import PowerConverter, TemperatureConverter
+
+from .const import DOMAIN
+from .series import POINT_TIME_KEY, PowerSeries
+
+_LOGGER = logging.getLogger(__name__)
+
+# Point key -> (statistic suffix, name, unit, unit class) for power points.
+POWER_POINT_STATISTICS = {
+    "generationPower": (
+        "generation_power",
+        "Generation Power",
+        UnitOfPower.WATT,
+        PowerConverter.UNIT_CLASS,
+    ),
+    "usePower": (
+        "use_power",
+        "Use Power",
+        UnitOfPower.WATT,
+        PowerConverter.UNIT_CLASS,
+    ),
+    "batteryPower": (
+        "battery_power",
+        "Battery Power",
+        UnitOfPower.WATT,
+        PowerConverter.UNIT_CLASS,
+    ),
+    "buyPower": (
+        "buy_power",
+        "Grid Buy Power",
+        UnitOfPower.WATT,
+        PowerConverter.UNIT_CLASS,
+    ),
+    "batterySoc": (
+        "battery_soc",
+        "Battery SOC",
+        PERCENTAGE,
+        None,
+    ),
+}
+
+# Point key -> (statistic suffix, name, unit, unit class) for weather points.
+WEATHER_POINT_STATISTICS = {
+    "temp": (
+        "weather_temperature",
+        "Weather Temperature",
+        UnitOfTemperature.CELSIUS,
+        TemperatureConverter.UNIT_CLASS,
+    ),
+}
+
+
+def statistic_id(station_id: int, suffix: str) -> str:
+    """Return the external statistic id of a station series."""
+    return f"{DOMAIN}:station_{station_id}_{suffix}"
+
+
+def station_statistic_ids(station_id: int) -> list[str]:
+    """Return every external statistic id published for a station."""
+    return [
+        statistic_id(station_id, suffix)
+        for suffix, *_ in (
+            *POWER_POINT_STATISTICS.values(),
+            *WEATHER_POINT_STATISTICS.values(),
+        )
+    ]
+
+
+def _hourly_statistics(
+    points: Iterable[dict[str, Any]],
+    time_key: str,
+    value_key: str,
+    since: datetime | None,
+) -> list[StatisticData]:
+    """Aggregate timestamped points into hourly mean/min/max rows.
+
+    Hours starting after now are dropped, which keeps forecast weather points
+    out of the statistics.
+    """
+    now = dt_util.utcnow()
+    if isinstance(points, PowerSeries) and time_key == POINT_TIME_KEY:
+        # Read the typed columns directly instead of rebuilding point dicts.
+        pairs = zip(points.timestamps, points.column(value_key))
+    else:
+        pairs = ((point.get(time_key), point.get(value_key)) for point in points)
+
+    buckets: dict[datetime, list[float]] = {}
+    for timestamp, value in pairs:
+        if timestamp is None or value is None or value != value:
+            continue
+        try:
+            start = dt_util.utc_from_timestamp(float(timestamp)).replace(
+                minute=0, second=0, microsecond=0
+            )
+            value = float(value)
+        except (TypeError, ValueError, OverflowError):
+            continue
+        if start > now or (since is not None and start < since):
+            continue
+        buckets.setdefault(start, []).append(value)
+
+    return [
+        StatisticData(
+            start=start,
+            mean=sum(values) / len(values),
+            min=min(values),
+            max=max(values),
+        )
+        for start, values in sorted(buckets.items())
+    ]
+
+
+def _statistic_metadata(
+    stat_id: str, station_name: str, name: str, unit: str, unit_class: str | None
+) -> StatisticMetaData:
+    """Return the metadata of a station series."""
+    return StatisticMetaData(
+        mean_type=StatisticMeanType.ARITHMETIC,
+        has_sum=False,
+        name=f"{station_name} {name}",
+        source=DOMAIN,
+        statistic_id=stat_id,
+        unit_class=unit_class,
+        unit_of_measurement=unit,
+    )
+
+
+@callback
+def async_import_history(
+    hass: HomeAssistant,
+    station_id: int,
+    station_name: str,
+    points: PowerSeries,
+) -> int:
+    """Import past power points of a station, one batch per statistic.
+
+    Meant for days fetched after the fact: every hour found is written,
+    regardless of what the live importer already sent. Returns the number of
+    hourly rows imported.
+    """
+    imported = 0
+    for value_key, (suffix, name, unit, unit_class) in POWER_POINT_STATISTICS.items():
+        stat_id = statistic_id(station_id, suffix)
+        rows = _hourly_statistics(points, POINT_TIME_KEY, value_key, None)
+        if not rows:
+            continue
+        metadata = _statistic_metadata(stat_id, station_name, name, unit, unit_class)
+        async_add_external_statistics(hass, metadata, rows)
+        imported += len(rows)
+    return imported
+
+
+class DayCurveStatisticsImporter:
+    """Import station day curves as external long-term statistics.
+
+    Only the hours from the last imported one onward are sent again, so the
+    still-open hour is updated in place and closed hours are written once.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the importer."""
+        self.hass = hass
+        self._imported_until: dict[str, datetime] = {}
+
+    def async_import_items(self, items: Iterable[dict[str, Any]]) -> None:
+        """Import the day curves of every station item."""
+        for item in items:
+            station = item.get("station", {})
+            station_id = station.get("id")
+            if not station_id:
+                continue
+            station_name = station.get("name", str(station_id))
+
+            # Final points of the previous day, present right after midnight
+            # until imported here.
+            if previous_points := item.pop("station_history_previous_power_list", None):
+                self._async_import_points(
+                    station_id,
+                    station_name,
+                    previous_points,
+                    POINT_TIME_KEY,
+                    POWER_POINT_STATISTICS,
+                )
+            self._async_import_points(
+                station_id,
+                station_name,
+                item.get("station_history_power_list") or [],
+                POINT_TIME_KEY,
+                POWER_POINT_STATISTICS,
+            )
+            self._async_import_points(
+                station_id,
+                station_name,
+                item.get("weather_day") or [],
+                "datetime",
+                WEATHER_POINT_STATISTICS,
+            )
+
+    def _async_import_points(
+        self,
+        station_id: int,
+        station_name: str,
+        points: Iterable[dict[str, Any]],
+        time_key: str,
+        fields: dict[str, tuple[str, str, str, str | None]],
+    ) -> None:
+        """Import the hourly rows of each field of a point list."""
+        for value_key, (suffix, name, unit, unit_class) in fields.items():
+            stat_id = statistic_id(station_id, suffix)
+            rows = _hourly_statistics(
+                points, time_key, value_key, self._imported_until.get(stat_id)
+            )
+            if not rows:
+                continue
+
+            metadata = _statistic_metadata(
+                stat_id, station_name, name, unit, unit_class
+            )
+            async_add_external_statistics(self.hass, metadata, rows)
+            self._imported_until[stat_id] = rows[-1]["start"]
+            _LOGGER.debug("Imported %d hourly rows into %s", len(rows), stat_id)
@@ -0,0 +1,156 @@
+"""Persistent storage helpers for TSUN Monitoring."""
+from __future__ import annotations
+
+from datetime import datetime
+from functools import partial
+import gzip
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.singleton import singleton
+from homeassistant.helpers.storage import STORAGE_DIR, Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .series import PowerSeries
+
+_LOGGER = logging.getLogger(__name__)
+
+TOKEN_STORAGE_KEY = f"{DOMAIN}.tokens"
+TOKEN_STORAGE_VERSION = 1
+TOKEN_SAVE_DELAY = 1
+
+DATA_TOKEN_STORE = f"{DOMAIN}_token_store"
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 10
+
+
+class TokenStore:
+    """OAuth tokens of every configured account, keyed by username.
+
+    Tokens are keyed by username rather than config entry so the config flow
+    can hand the token of its credential check to the entry it creates.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the token store."""
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, TOKEN_STORAGE_VERSION, TOKEN_STORAGE_KEY, private=True
+        )
+        self._tokens: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the stored tokens."""
+        self._tokens = await self._store.async_load() or {}
+
+    @callback
+    def async_get(self, username: str) -> dict[str, Any] | None:
+        """Return the stored tokens of an account."""
+        return self._tokens.get(username)
+
+    @callback
+    def async_set(self, username: str, tokens: dict[str, Any]) -> None:
+        """Update the tokens of an account and schedule a save."""
+        self._tokens[username] = dict(tokens)
+        self._store.async_delay_save(lambda: self._tokens, TOKEN_SAVE_DELAY)
+
+    @callback
+    def async_remove(self, username: str) -> None:
+        """Forget the tokens of an account."""
+        if self._tokens.pop(username, None) is not None:
+            self._store.async_delay_save(lambda: self._tokens, TOKEN_SAVE_DELAY)
+
+
+@singleton(DATA_TOKEN_STORE)
+async def async_get_token_store(hass: HomeAssistant) -> TokenStore:
+    """Return the shared token store, loading it on first use."""
+    token_store = TokenStore(hass)
+    await token_store.async_load()
+    return token_store
+
+
+def _snapshot_items(data: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return copies of station items with power series turned into points.
+
+    Runs in the event loop: the series are shared with the history buffers,
+    which keep growing while the executor encodes the snapshot.
+    """
+    return [
+        {
+            key: value.to_points() if isinstance(value, PowerSeries) else value
+            for key, value in item.items()
+        }
+        for item in data
+    ]
+
+
+class SnapshotStore:
+    """Gzip-compressed snapshot of the last successful coordinator payload.
+
+    Home Assistant's ``Store`` writes plain JSON, which is large for day
+    curves, so the snapshot is written by hand in the executor next to the
+    other storage files.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the snapshot store of a config entry."""
+        self.hass = hass
+        self.path = Path(
+            hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.snapshot.json.gz")
+        )
+
+    def _read(self) -> dict[str, Any] | None:
+        """Read and decode the snapshot file."""
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def _write(self, payload: dict[str, Any]) -> None:
+        """Encode and atomically replace the snapshot file."""
+        encoded = json.dumps(payload, separators=(",", ":"), default=str)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as file:
+            file.write(encoded)
+        os.replace(tmp_path, self.path)
+
+    async def async_load(self) -> tuple[list[dict[str, Any]], datetime] | None:
+        """Return the snapshot data and when it was saved, if usable."""
+        try:
+            payload = await self.hass.async_add_executor_job(self._read)
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Ignoring unreadable snapshot %s: %s", self.path, err)
+            return None
+
+        if not payload or payload.get("version") != SNAPSHOT_VERSION:
+            return None
+        saved_at = dt_util.parse_datetime(payload.get("saved_at") or "")
+        data = payload.get("data")
+        if saved_at is None or not isinstance(data, list):
+            return None
+        return data, saved_at
+
+    async def async_save(self, data: list[dict[str, Any]]) -> None:
+        """Save coordinator data as the latest snapshot."""
+        payload = {
+            "version": SNAPSHOT_VERSION,
+            "saved_at": dt_util.utcnow().isoformat(),
+            "data": _snapshot_items(data),
+        }
+        try:
+            await self.hass.async_add_executor_job(self._write, payload)
+        except (OSError, TypeError, ValueError) as err:
+            _LOGGER.warning("Failed to save snapshot %s: %s", self.path, err)
+
+    async def async_remove(self) -> None:
+        """Delete the snapshot file."""
+        await self.hass.async_add_executor_job(
+            partial(self.path.unlink, missing_ok=True)
+        )
@@ -0,0 +1,147 @@
+"""Websocket API of the TSUN Monitoring integration.
+
+Day series are large and only useful while a chart is shown, so cards fetch
+them on demand here instead of reading them from state attributes.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_GRAPH_POINTS, DEFAULT_GRAPH_POINTS, DOMAIN
+from .series import DOWNSAMPLE_LTTB, DOWNSAMPLE_MINMAX, PowerSeries
+
+# Time key of the day weather points.
+WEATHER_TIME_KEY = "datetime"
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the websocket commands of the integration."""
+    websocket_api.async_register_command(hass, ws_day_series)
+
+
+def _entity_station_id(hass: HomeAssistant, entity_id: str) -> int | None:
+    """Return the id of the station an entity of the integration belongs to."""
+    entity_entry = er.async_get(hass).async_get(entity_id)
+    if (
+        entity_entry is None
+        or entity_entry.platform != DOMAIN
+        or entity_entry.device_id is None
+    ):
+        return None
+    device = dr.async_get(hass).async_get(entity_entry.device_id)
+    if device is None:
+        return None
+    for domain, identifier in device.identifiers:
+        if domain != DOMAIN:
+            continue
+        try:
+            return int(identifier)
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def _timestamp(value: str | None) -> float | None:
+    """Return the epoch timestamp of an ISO datetime, local time if naive."""
+    if value is None:
+        return None
+    if (parsed := dt_util.parse_datetime(value)) is None:
+        raise ValueError(f"Invalid datetime: {value}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.get_default_time_zone())
+    return parsed.timestamp()
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/day_series",
+        vol.Exclusive("station_id", "station"): vol.Coerce(int),
+        vol.Exclusive("entity_id", "station"): cv.entity_id,
+        vol.Optional("points"): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional("start_time"): str,
+        vol.Optional("end_time"): str,
+        vol.Optional("method", default=DOWNSAMPLE_LTTB): vol.In(
+            [DOWNSAMPLE_LTTB, DOWNSAMPLE_MINMAX]
+        ),
+    }
+)
+@callback
+def ws_day_series(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the day series of a station.
+
+    The station is given by id or by any of its entities. Power points are
+    limited to ``start_time``..``end_time`` when given, then downsampled to
+    about ``points`` (0 keeps them all); without ``points`` the entry's graph
+    points option applies. Weather points are limited to the same range.
+    """
+    if "entity_id" in msg:
+        station_id = _entity_station_id(hass, msg["entity_id"])
+    else:
+        station_id = msg.get("station_id")
+    if station_id is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_INVALID_FORMAT,
+            "A station_id or an entity_id of a station is required",
+        )
+        return
+
+    try:
+        start = _timestamp(msg.get("start_time"))
+        end = _timestamp(msg.get("end_time"))
+    except ValueError as err:
+        connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, str(err))
+        return
+
+    for entry_id, entry_data in hass.data.get(DOMAIN, {}).items():
+        if (station := entry_data.coordinator.stations.get(station_id)) is not None:
+            break
+    else:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"Unknown station {station_id}"
+        )
+        return
+
+    if (points := msg.get("points")) is None:
+        entry = hass.config_entries.async_get_entry(entry_id)
+        points = int(entry.options.get(CONF_GRAPH_POINTS, DEFAULT_GRAPH_POINTS))
+
+    item = station.data
+    power_series = item.get("station_history_power_list") or []
+    if not isinstance(power_series, PowerSeries):
+        power_series = PowerSeries(power_series)
+    weather_points = [
+        point
+        for point in item.get("weather_day") or []
+        if isinstance(point, dict)
+        and (start is None or (point.get(WEATHER_TIME_KEY) or 0) >= start)
+        and (end is None or (point.get(WEATHER_TIME_KEY) or 0) <= end)
+    ]
+
+    connection.send_result(
+        msg["id"],
+        {
+            "station_id": station_id,
+            "day_summary": item.get("station_history_day") or {},
+            "power_points": power_series.points(
+                target=points, start=start, end=end, method=msg["method"]
+            ),
+            "weather_points": weather_points,
+            "segment_day": item.get("station_history_segment_day") or {},
+            "section_updated_at": item.get("section_updated_at") or {},
+        },
+    )
@@ -0,0 +1,27 @@
+"""Import the integration modules without Home Assistant installed."""
+from __future__ import annotations
+
+import importlib
+from pathlib import Path
+import sys
+import types
+
+COMPONENT_DIR = (
+    Path(__file__).resolve().parents[2] / "custom_components" / "tsun_monitoring"
+)
+PACKAGE = "tsun_monitoring"
+
+
+def load_module(name: str) -> types.ModuleType:
+    """Return an integration module, e.g. ``load_module("api")``.
+
+    The package ``__init__`` of the integration imports Home Assistant, so a
+    bare package pointing at the same directory is registered instead. The
+    modules loaded through it (``api``, ``const``, ``series``...) only use
+    relative imports between themselves.
+    """
+    if PACKAGE not in sys.modules:
+        package = types.ModuleType(PACKAGE)
+        package.__path__ = [str(COMPONENT_DIR)]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.{name}")
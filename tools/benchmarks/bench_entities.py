@@ -0,0 +1,310 @@
+"""Entity-layer benchmark of the TSUN Monitoring sensor platform.
+
+Runs the sensor platform of the integration on a bare Home Assistant core
+against generated coordinator data of growing size and reports, per station
+count: entities created and enabled, platform setup time, event-loop CPU
+time of a coordinator update (with changed and with unchanged data), the
+state writes it causes and the serialized size of the states. Home Assistant
+must be installed::
+
+    python tools/benchmarks/bench_entities.py --stations 1 10 100 1000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
+import json
+import logging
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+)
+from homeassistant.helpers.entity_platform import EntityPlatform
+from homeassistant.helpers.json import json_bytes
+
+import fixtures
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from custom_components.tsun_monitoring import TsunMonitoringData, sensor  # noqa: E402
+from custom_components.tsun_monitoring.const import (  # noqa: E402
+    CONF_DAY_GRAPH_STATISTICS,
+    DOMAIN,
+)
+from custom_components.tsun_monitoring.series import PowerSeries  # noqa: E402
+
+_LOGGER = logging.getLogger(__name__)
+
+ALERTS_PER_STATION = 3
+
+
+def build_items(stations: int, now: datetime) -> list[dict[str, Any]]:
+    """Return coordinator data for ``stations`` stations at ``now``."""
+    items = []
+    for station_id in range(1, stations + 1):
+        station = fixtures.station_payload(station_id, now=now)
+        history = fixtures.history_day_payload(station_id, now)
+        alerts = fixtures.alert_records([station_id], stations, ALERTS_PER_STATION)
+        items.append(
+            {
+                "station": station,
+                "station_status_count": fixtures.status_count_payload(
+                    stations, ALERTS_PER_STATION
+                ),
+                "station_history_day": history["stationStatisticDay"],
+                "station_history_power_list": PowerSeries(
+                    history["stationStatisticPowerList"]
+                ),
+                "station_history_segment_day": history["stationStatisticSegmentDay"],
+                "weather_day": fixtures.weather_day_payload(
+                    station["regionLevel1"], now
+                ),
+                "station_manage": fixtures.manage_payload(station_id),
+                "station_energy_saved": fixtures.energy_saved_payload(station_id),
+                "station_current_flow": fixtures.current_flow_payload(station),
+                "station_scene": "HOME",
+                "station_alerts": {"data": alerts, "total": len(alerts)},
+            }
+        )
+    return items
+
+
+class _BenchListeners:
+    """Listener handling shared by the stand-in coordinators."""
+
+    restored = False
+    restored_at = None
+    last_update_success = True
+    last_refresh = None
+    last_revalidation = None
+
+    def __init__(self) -> None:
+        """Initialize without listeners."""
+        self._listeners: dict[object, Callable[[], None]] = {}
+
+    @callback
+    def async_add_listener(
+        self, update_callback: Callable[[], None], context: Any = None
+    ) -> Callable[[], None]:
+        """Register an entity update callback."""
+        key = object()
+        self._listeners[key] = update_callback
+        return lambda: self._listeners.pop(key, None)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify every listener."""
+        for update_callback in list(self._listeners.values()):
+            update_callback()
+
+
+class BenchStationCoordinator(_BenchListeners):
+    """Stand-in for the coordinator of one station."""
+
+    def __init__(self, station_id: int, item: dict[str, Any]) -> None:
+        """Initialize with the station item."""
+        super().__init__()
+        self.station_id = station_id
+        self.data = item
+
+    def get_station_item(self, station_id: int) -> dict[str, Any] | None:
+        """Return the item of the station."""
+        return self.data if station_id == self.station_id else None
+
+
+class BenchCoordinator(_BenchListeners):
+    """Stand-in for the station list coordinator, as used by the entities."""
+
+    api = SimpleNamespace(
+        request_count=0, endpoint_metrics={}, disabled_sections=frozenset()
+    )
+
+    def __init__(self, data: list[dict[str, Any]]) -> None:
+        """Initialize with the first data."""
+        super().__init__()
+        self.stations: dict[int, BenchStationCoordinator] = {}
+        self._apply(data)
+
+    def _apply(self, data: list[dict[str, Any]]) -> None:
+        """Replace the data and hand each item to its station coordinator."""
+        self.data = data
+        for item in data:
+            station_id = item["station"]["id"]
+            if (station := self.stations.get(station_id)) is None:
+                self.stations[station_id] = BenchStationCoordinator(station_id, item)
+            else:
+                station.data = item
+
+    def get_station_item(self, station_id: int) -> dict[str, Any] | None:
+        """Return the item of a station."""
+        station = self.stations.get(station_id)
+        return None if station is None else station.data
+
+    @callback
+    def async_set_updated_data(self, data: list[dict[str, Any]]) -> None:
+        """Replace the data and notify every entity.
+
+        Stands for a station list update followed by an update of every
+        station coordinator.
+        """
+        self._apply(data)
+        self.async_update_listeners()
+        for station in self.stations.values():
+            station.async_update_listeners()
+
+
+async def run_case(args: argparse.Namespace, stations: int) -> dict[str, Any]:
+    """Benchmark the sensor platform for one station count."""
+    noon = datetime.now().replace(hour=13, minute=0, second=0, microsecond=0)
+    coordinator = BenchCoordinator(build_items(stations, noon))
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        entity.async_setup(hass)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+
+        written: list[int] = []
+
+        @callback
+        def _count_write(event: Event) -> None:
+            if (new_state := event.data.get("new_state")) is not None:
+                written.append(len(json_bytes(new_state.as_dict())))
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _count_write)
+
+        unload_callbacks: list[Callable[[], Any]] = []
+        entry = SimpleNamespace(
+            entry_id="bench",
+            options={
+                CONF_DAY_GRAPH_STATISTICS: args.graph_statistics,
+            },
+            async_on_unload=unload_callbacks.append,
+        )
+        hass.data[DOMAIN] = {entry.entry_id: TsunMonitoringData(coordinator)}
+        platform = EntityPlatform(
+            hass=hass,
+            logger=_LOGGER,
+            domain="sensor",
+            platform_name=DOMAIN,
+            platform=None,
+            scan_interval=timedelta(seconds=30),
+            entity_namespace=None,
+        )
+
+        entities: list[Any] = []
+        start = time.perf_counter()
+        await sensor.async_setup_entry(hass, entry, entities.extend)
+        created = time.perf_counter()
+        await platform.async_add_entities(entities)
+        await hass.async_block_till_done()
+        added = time.perf_counter()
+
+        state_bytes = [
+            len(json_bytes(state.as_dict())) for state in hass.states.async_all()
+        ]
+
+        async def _update(data: list[dict[str, Any]]) -> tuple[float, int, int]:
+            """Push data and return loop CPU time, writes and written bytes."""
+            written.clear()
+            cpu = time.process_time()
+            coordinator.async_set_updated_data(data)
+            cpu = time.process_time() - cpu
+            await hass.async_block_till_done()
+            return cpu, len(written), sum(written)
+
+        step = fixtures.HISTORY_STEP
+        changed = [
+            await _update(build_items(stations, noon + step * (index + 1)))
+            for index in range(args.updates)
+        ]
+        moment = noon + step * args.updates
+        unchanged = [
+            await _update(build_items(stations, moment)) for _ in range(args.updates)
+        ]
+
+        for unload in unload_callbacks:
+            unload()
+        await platform.async_reset()
+        await hass.async_stop(force=True)
+
+    return {
+        "stations": stations,
+        "entities": len(entities),
+        "enabled": len(state_bytes),
+        "create_s": round(created - start, 4),
+        "setup_s": round(added - start, 4),
+        "update_cpu_ms": round(statistics.median(c[0] for c in changed) * 1000, 2),
+        "update_writes": changed[-1][1],
+        "update_bytes": changed[-1][2],
+        "unchanged_cpu_ms": round(
+            statistics.median(u[0] for u in unchanged) * 1000, 2
+        ),
+        "unchanged_writes": unchanged[-1][1],
+        "state_bytes": sum(state_bytes),
+        "largest_state_bytes": max(state_bytes, default=0),
+    }
+
+
+def _print_table(results: list[dict[str, Any]]) -> None:
+    """Print the results as a table."""
+    columns = (
+        ("stations", "stations", "d"),
+        ("entities", "entities", "d"),
+        ("enabled", "enabled", "d"),
+        ("setup_s", "setup s", ".3f"),
+        ("update_cpu_ms", "upd ms", ".1f"),
+        ("update_writes", "upd writes", "d"),
+        ("update_bytes", "upd bytes", "d"),
+        ("unchanged_cpu_ms", "same ms", ".1f"),
+        ("unchanged_writes", "same writes", "d"),
+        ("state_bytes", "state bytes", "d"),
+        ("largest_state_bytes", "max state", "d"),
+    )
+    header = " ".join(f"{title:>11}" for _, title, _ in columns)
+    print(header)
+    print("-" * len(header))
+    for case in results:
+        print(" ".join(f"{case[key]:>11{fmt}}" for key, _, fmt in columns))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the command line parser."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--stations", type=int, nargs="+", default=[1, 10, 100, 1000]
+    )
+    parser.add_argument("--updates", type=int, default=3, help="updates per case")
+    parser.add_argument(
+        "--graph-statistics",
+        action="store_true",
+        help="summary-only Day Graph, as with the statistics option",
+    )
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    return parser
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Run every case."""
+    results = [await run_case(args, stations) for stations in args.stations]
+    _print_table(results)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(build_parser().parse_args())))
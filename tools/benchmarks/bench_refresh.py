@@ -0,0 +1,203 @@
+"""Refresh benchmark of the TSUN Monitoring API client.
+
+Starts the local stand-in server (``mock_server.py``) in a subprocess for each
+station count, then measures ``TsunMonitoringAsyncAPI.get_stations()``: end to
+end latency, request count and peak Python memory of the client. Example::
+
+    python tools/benchmarks/bench_refresh.py --stations 1 10 100 1000 \
+        --latency 20 --output results.json
+
+Pass ``--baseline`` with the output of an earlier run to fail (exit code 1)
+when a metric regresses by more than ``--tolerance``.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+import aiohttp
+
+from _component import load_module
+
+api_module = load_module("api")
+
+MOCK_SERVER = Path(__file__).with_name("mock_server.py")
+
+# Metrics compared against a baseline; lower is better for all of them.
+COMPARED_METRICS = ("latency_median_s", "requests_first", "requests_next", "peak_mib")
+
+
+async def _start_server(
+    args: argparse.Namespace, stations: int
+) -> tuple[asyncio.subprocess.Process, str]:
+    """Start the mock server for a station count and return its base URL."""
+    command = [
+        sys.executable,
+        str(MOCK_SERVER),
+        "--port",
+        "0",
+        "--stations",
+        str(stations),
+        "--latency",
+        str(args.latency),
+        "--jitter",
+        str(args.jitter),
+        "--error-rate",
+        str(args.error_rate),
+        "--seed",
+        "1",
+    ]
+    for endpoint in args.fail:
+        command += ["--fail", endpoint]
+    process = await asyncio.create_subprocess_exec(
+        *command, stdout=asyncio.subprocess.PIPE
+    )
+    line = await asyncio.wait_for(process.stdout.readline(), timeout=30)
+    if not line:
+        raise RuntimeError("The mock server did not start")
+    return process, line.decode().rsplit(" ", 1)[-1].strip()
+
+
+async def _server_requests(session: aiohttp.ClientSession, url: str) -> int:
+    """Return the number of API requests served since the last reset, and reset."""
+    async with session.get(f"{url}/__stats") as response:
+        total = (await response.json())["total"]
+    async with session.post(f"{url}/__reset") as response:
+        await response.read()
+    return total
+
+
+async def run_case(args: argparse.Namespace, stations: int) -> dict[str, Any]:
+    """Benchmark refreshes for one station count."""
+    process, url = await _start_server(args, stations)
+    try:
+        async with aiohttp.ClientSession() as session:
+            api = api_module.TsunMonitoringAsyncAPI(
+                session,
+                "bench@example.com",
+                "bench",
+                max_concurrency=args.max_concurrency,
+                station_concurrency=args.station_concurrency,
+                base_url=url,
+            )
+            await api.authenticate()
+            await _server_requests(session, url)
+
+            latencies: list[float] = []
+            requests: list[int] = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                items = await api.get_stations()
+                latencies.append(time.perf_counter() - start)
+                requests.append(await _server_requests(session, url))
+
+            # Memory is measured on its own run: tracing slows the client down.
+            tracemalloc.start()
+            await api.get_stations()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            await _server_requests(session, url)
+    finally:
+        process.terminate()
+        await process.wait()
+
+    return {
+        "stations": stations,
+        "items": len(items),
+        "latency_first_s": round(latencies[0], 4),
+        "latency_median_s": round(statistics.median(latencies), 4),
+        "requests_first": requests[0],
+        "requests_next": requests[-1],
+        "peak_mib": round(peak / 2**20, 2),
+    }
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: list[dict[str, Any]], tolerance: float
+) -> list[str]:
+    """Return the metrics that regressed against a baseline."""
+    previous = {case["stations"]: case for case in baseline}
+    regressions = []
+    for case in results:
+        if (reference := previous.get(case["stations"])) is None:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = reference.get(metric), case.get(metric)
+            if old is None or new is None:
+                continue
+            if new > old * (1 + tolerance) and new - old > 1e-3:
+                regressions.append(
+                    f"{case['stations']} stations: {metric} {old} -> {new}"
+                )
+    return regressions
+
+
+def _print_table(results: list[dict[str, Any]]) -> None:
+    """Print the results as a table."""
+    header = (
+        f"{'stations':>8} {'first s':>9} {'median s':>9} "
+        f"{'req first':>9} {'req next':>9} {'peak MiB':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for case in results:
+        print(
+            f"{case['stations']:>8} {case['latency_first_s']:>9.3f} "
+            f"{case['latency_median_s']:>9.3f} {case['requests_first']:>9} "
+            f"{case['requests_next']:>9} {case['peak_mib']:>9.2f}"
+        )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the command line parser."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--stations", type=int, nargs="+", default=[1, 10, 100, 1000]
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="refreshes per case")
+    parser.add_argument("--latency", type=float, default=20, help="milliseconds")
+    parser.add_argument("--jitter", type=float, default=5, help="milliseconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--fail", action="append", default=[], metavar="ENDPOINT")
+    parser.add_argument(
+        "--max-concurrency", type=int, default=api_module.DEFAULT_MAX_CONCURRENCY
+    )
+    parser.add_argument(
+        "--station-concurrency",
+        type=int,
+        default=api_module.DEFAULT_STATION_CONCURRENCY,
+    )
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--baseline", type=Path, help="JSON results to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    return parser
+
+
+async def main(args: argparse.Namespace) -> int:
+    """Run every case and return the exit code."""
+    results = [await run_case(args, stations) for stations in args.stations]
+    _print_table(results)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+
+    if args.baseline:
+        regressions = compare(
+            results, json.loads(args.baseline.read_text()), args.tolerance
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(build_parser().parse_args())))
@@ -0,0 +1,155 @@
+"""Generated TSUN Monitoring payloads shared by the benchmark tools."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+import math
+from typing import Any
+
+# Power points of the day history, one every five minutes.
+HISTORY_STEP = timedelta(minutes=5)
+
+
+def _capacity(station_id: int) -> float:
+    """Return the installed capacity of a station, in kW."""
+    return 3.0 + station_id % 5
+
+
+def solar_factor(moment: datetime) -> float:
+    """Return a 0..1 bell curve of the sun over the local day."""
+    hours = moment.hour + moment.minute / 60
+    if not 6 <= hours <= 20:
+        return 0.0
+    return max(0.0, math.sin(math.pi * (hours - 6) / 14))
+
+
+def station_payload(
+    station_id: int, regions: int = 20, now: datetime | None = None
+) -> dict[str, Any]:
+    """Return the payload of a station in the station list."""
+    now = now or datetime.now()
+    capacity = _capacity(station_id)
+    generation = round(capacity * 1000 * solar_factor(now) * 0.8)
+    use = 300 + station_id % 7 * 50
+    return {
+        "id": station_id,
+        "name": f"Station {station_id:04d}",
+        "powerType": "PV",
+        "powerSystemType": "GEN_GRID_USE_BTR",
+        "geographyType": "HOUSE_ROOF",
+        "operationType": "SELF",
+        "operating": True,
+        "locationAddress": f"{station_id} rue du Soleil",
+        "installedCapacity": capacity,
+        "generationPower": generation,
+        "usePower": use,
+        "batteryPower": generation - use,
+        "batterySoc": 20 + station_id % 80,
+        "generationValue": round(capacity * 2.5, 2),
+        "generationValueMonth": round(capacity * 60, 2),
+        "generationValueYear": round(capacity * 900, 2),
+        "generationTotal": round(capacity * 3000, 2),
+        "lastUpdateTime": int(now.timestamp()),
+        "regionNationId": 1,
+        "regionLevel1": station_id % max(1, regions),
+        "regionLevel2": 1,
+    }
+
+
+def status_count_payload(stations: int, alerts: int) -> dict[str, Any]:
+    """Return the account status counters."""
+    return {"total": stations, "online": stations, "offline": 0, "alert": alerts}
+
+
+def history_day_payload(
+    station_id: int, now: datetime | None = None
+) -> dict[str, Any]:
+    """Return the day history of a station, with points up to ``now``."""
+    now = now or datetime.now()
+    capacity = _capacity(station_id)
+    moment = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    points = []
+    soc = 50.0
+    while moment <= now:
+        generation = round(capacity * 1000 * solar_factor(moment) * 0.8)
+        use = 300 + (moment.hour % 6) * 40
+        soc = min(100.0, max(5.0, soc + (generation - use) / 2000))
+        points.append(
+            {
+                "dateTime": int(moment.timestamp()),
+                "generationPower": generation,
+                "usePower": use,
+                "batteryPower": generation - use,
+                "buyPower": max(0, use - generation),
+                "batterySoc": round(soc, 1),
+            }
+        )
+        moment += HISTORY_STEP
+    return {
+        "stationStatisticDay": {
+            "generationValue": round(capacity * 2.5, 2),
+            "useValue": 6.2,
+            "buyValue": 1.4,
+            "sellValue": 0.8,
+        },
+        "stationStatisticPowerList": points,
+        "stationStatisticSegmentDay": {"segments": []},
+    }
+
+
+def weather_day_payload(
+    region: int, now: datetime | None = None
+) -> list[dict[str, Any]]:
+    """Return the hourly weather points of a region for the day."""
+    now = now or datetime.now()
+    start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return [
+        {
+            "datetime": int((start + timedelta(hours=hour)).timestamp()),
+            "temp": round(8 + region % 5 + 6 * math.sin(math.pi * hour / 24), 1),
+            "weather": "sunny",
+        }
+        for hour in range(24)
+    ]
+
+
+def manage_payload(station_id: int) -> dict[str, Any]:
+    """Return the settings of a station."""
+    return {"id": station_id, "timeZone": "Europe/Paris", "currency": "EUR"}
+
+
+def energy_saved_payload(station_id: int) -> dict[str, Any]:
+    """Return the environmental impact counters of a station."""
+    return {
+        "co2": 1.2 * station_id,
+        "tree": 0.1 * station_id,
+        "coal": 0.5 * station_id,
+    }
+
+
+def current_flow_payload(station: dict[str, Any]) -> dict[str, Any]:
+    """Return the current energy flow of a station payload."""
+    return {
+        "pvPower": station["generationPower"],
+        "loadPower": station["usePower"],
+        "batteryPower": station["batteryPower"],
+        "gridPower": max(0, station["usePower"] - station["generationPower"]),
+    }
+
+
+def alert_records(
+    station_ids: Iterable[int], stations: int, per_station: int
+) -> list[dict[str, Any]]:
+    """Return the alerts of the given stations, newest first."""
+    return [
+        {
+            "id": station_id * 1000 + index,
+            "stationId": station_id,
+            "alertType": "WARNING",
+            "alertStatus": "CLOSED",
+            "startTime": 1_700_000_000 + (per_station - index) * 3600,
+        }
+        for station_id in station_ids
+        if 0 < station_id <= stations
+        for index in range(per_station)
+    ]
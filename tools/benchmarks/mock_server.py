@@ -0,0 +1,340 @@
+"""Local stand-in for the TSUN Monitoring cloud API.
+
+Implements every endpoint of ``const.py`` with generated data for a
+configurable number of stations, plus latency and error injection. Run it on
+its own::
+
+    python tools/benchmarks/mock_server.py --stations 100 --latency 20
+
+or embed :class:`MockTsunServer` in a script. Request counters are served on
+``GET /__stats`` and reset with ``POST /__reset``.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from collections.abc import Iterable
+from datetime import datetime
+import random
+import socket
+from urllib.parse import urlsplit
+
+from aiohttp import web
+
+from _component import load_module
+import fixtures
+
+const = load_module("const")
+
+ENDPOINT_TOKEN = "token"
+
+ACCESS_TOKEN = "mock-access-token"
+REFRESH_TOKEN = "mock-refresh-token"
+TOKEN_LIFETIME = 3600
+
+MAINTENANCE_PAGE = "<html><body><h1>Maintenance</h1></body></html>"
+
+
+def _path(url: str) -> str:
+    """Return the path of an API URL."""
+    return urlsplit(url).path
+
+
+class MockTsunServer:
+    """aiohttp application serving generated TSUN Monitoring payloads.
+
+    ``latency`` and ``jitter`` are in seconds. Each request (except token
+    requests) fails with ``error_status`` with probability ``error_rate``;
+    endpoints listed in ``fail_endpoints`` always fail, and those listed in
+    ``html_endpoints`` answer 200 with an HTML maintenance page. Stations are
+    spread over ``regions`` weather regions.
+    """
+
+    def __init__(
+        self,
+        stations: int = 10,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 500,
+        fail_endpoints: Iterable[str] = (),
+        html_endpoints: Iterable[str] = (),
+        regions: int = 20,
+        alerts_per_station: int = 3,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the server state."""
+        self.stations = stations
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.fail_endpoints = set(fail_endpoints)
+        self.html_endpoints = set(html_endpoints)
+        self.regions = max(1, regions)
+        self.alerts_per_station = alerts_per_station
+        self.counts: Counter[str] = Counter()
+        self._random = random.Random(seed)
+        self._runner: web.AppRunner | None = None
+
+    def app(self) -> web.Application:
+        """Return the aiohttp application."""
+        app = web.Application(middlewares=[self._middleware])
+        routes = [
+            ("POST", const.API_AUTH_URL, ENDPOINT_TOKEN, self._token),
+            ("POST", const.API_STATION_URL, const.ENDPOINT_STATION_LIST, self._list),
+            (
+                "POST",
+                const.API_STATION_STATUS_COUNT_URL,
+                const.ENDPOINT_STATUS_COUNT,
+                self._status_count,
+            ),
+            (
+                "GET",
+                f"{const.API_STATION_HISTORY_DAY_URL}/{{station_id}}",
+                const.SECTION_HISTORY_DAY,
+                self._history_day,
+            ),
+            (
+                "GET",
+                const.API_WEATHER_DAY_URL,
+                const.SECTION_WEATHER_DAY,
+                self._weather,
+            ),
+            (
+                "GET",
+                f"{const.API_STATION_MANAGE_URL}/{{station_id}}",
+                const.SECTION_MANAGE,
+                self._manage,
+            ),
+            (
+                "GET",
+                f"{const.API_STATION_ENERGY_SAVED_URL}/{{station_id}}",
+                const.SECTION_ENERGY_SAVED,
+                self._energy_saved,
+            ),
+            (
+                "GET",
+                f"{const.API_STATION_CURRENT_FLOW_URL}/{{station_id}}",
+                const.SECTION_CURRENT_FLOW,
+                self._current_flow,
+            ),
+            (
+                "GET",
+                f"{const.API_STATION_SCENE_URL}/{{station_id}}",
+                const.SECTION_SCENE,
+                self._scene,
+            ),
+            (
+                "POST",
+                const.API_STATION_ALERT_LIST_URL,
+                const.SECTION_ALERTS,
+                self._alerts,
+            ),
+        ]
+        for method, url, endpoint, handler in routes:
+            app.router.add_route(method, _path(url), handler, name=endpoint)
+        app.router.add_get("/__stats", self._stats)
+        app.router.add_post("/__reset", self._reset)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving and return the base URL (``port=0`` picks a free port)."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((host, port))
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        await web.SockSite(self._runner, sock).start()
+        return f"http://{host}:{sock.getsockname()[1]}"
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Count requests and inject latency, auth checks and errors."""
+        endpoint = request.match_info.route.name
+        if endpoint is None or endpoint.startswith("__"):
+            return await handler(request)
+        self.counts[endpoint] += 1
+
+        delay = self.latency + self._random.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        if endpoint != ENDPOINT_TOKEN:
+            if request.headers.get("authorization") != f"bearer {ACCESS_TOKEN}":
+                self.counts["unauthorized"] += 1
+                return web.Response(status=401)
+            if endpoint in self.fail_endpoints or (
+                self.error_rate and self._random.random() < self.error_rate
+            ):
+                self.counts["errors"] += 1
+                return web.Response(status=self.error_status)
+            if endpoint in self.html_endpoints:
+                return web.Response(text=MAINTENANCE_PAGE, content_type="text/html")
+        return await handler(request)
+
+    def _station_ids(self) -> range:
+        """Return the ids of the generated stations."""
+        return range(1, self.stations + 1)
+
+    async def _token(self, request: web.Request) -> web.Response:
+        """Issue tokens for password and refresh grants."""
+        return web.json_response(
+            {
+                "access_token": ACCESS_TOKEN,
+                "refresh_token": REFRESH_TOKEN,
+                "token_type": "bearer",
+                "expires_in": TOKEN_LIFETIME,
+            }
+        )
+
+    async def _list(self, request: web.Request) -> web.Response:
+        """Return every station."""
+        data = [
+            {"station": fixtures.station_payload(station_id, self.regions)}
+            for station_id in self._station_ids()
+        ]
+        return web.json_response({"data": data, "total": len(data)})
+
+    async def _status_count(self, request: web.Request) -> web.Response:
+        """Return the account status counters."""
+        return web.json_response(
+            fixtures.status_count_payload(
+                self.stations, min(self.stations, self.alerts_per_station)
+            )
+        )
+
+    async def _history_day(self, request: web.Request) -> web.Response:
+        """Return the day curve of a station, up to now for today."""
+        station_id = int(request.match_info["station_id"])
+        now = datetime.now()
+        try:
+            day = datetime(
+                int(request.query["year"]),
+                int(request.query["month"]),
+                int(request.query["day"]),
+            )
+        except (KeyError, ValueError):
+            day = now
+        if day.date() < now.date():
+            now = day.replace(hour=23, minute=59)
+        return web.json_response(fixtures.history_day_payload(station_id, now))
+
+    async def _weather(self, request: web.Request) -> web.Response:
+        """Return hourly weather points of the day."""
+        region = int(request.query.get("regionLevel1", 0))
+        return web.json_response(fixtures.weather_day_payload(region))
+
+    async def _manage(self, request: web.Request) -> web.Response:
+        """Return station settings."""
+        station_id = int(request.match_info["station_id"])
+        return web.json_response(fixtures.manage_payload(station_id))
+
+    async def _energy_saved(self, request: web.Request) -> web.Response:
+        """Return environmental impact counters."""
+        station_id = int(request.match_info["station_id"])
+        return web.json_response(fixtures.energy_saved_payload(station_id))
+
+    async def _current_flow(self, request: web.Request) -> web.Response:
+        """Return the current energy flow."""
+        station = fixtures.station_payload(
+            int(request.match_info["station_id"]), self.regions
+        )
+        return web.json_response(fixtures.current_flow_payload(station))
+
+    async def _scene(self, request: web.Request) -> web.Response:
+        """Return the station scene as plain text."""
+        return web.Response(text="HOME")
+
+    async def _alerts(self, request: web.Request) -> web.Response:
+        """Return one page of alerts of the requested stations."""
+        body = await request.json()
+        page = int(request.query.get("page", 1))
+        size = int(request.query.get("size", 50))
+        records = fixtures.alert_records(
+            body.get("stationIdList") or [], self.stations, self.alerts_per_station
+        )
+        start = (page - 1) * size
+        return web.json_response(
+            {
+                "data": records[start : start + size],
+                "total": len(records),
+                "page": page,
+                "size": size,
+            }
+        )
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        """Return the request counters."""
+        return web.json_response(
+            {"total": sum(self.counts.values()), "endpoints": dict(self.counts)}
+        )
+
+    async def _reset(self, request: web.Request) -> web.Response:
+        """Reset the request counters."""
+        self.counts.clear()
+        return web.json_response({})
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the command line parser."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080, help="0 picks a free port")
+    parser.add_argument("--stations", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0, help="milliseconds")
+    parser.add_argument("--jitter", type=float, default=0, help="milliseconds")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=500)
+    parser.add_argument(
+        "--fail",
+        action="append",
+        default=[],
+        metavar="ENDPOINT",
+        help="endpoint that always fails, e.g. weather_day (repeatable)",
+    )
+    parser.add_argument(
+        "--html",
+        action="append",
+        default=[],
+        metavar="ENDPOINT",
+        help="endpoint that answers an HTML maintenance page (repeatable)",
+    )
+    parser.add_argument("--regions", type=int, default=20)
+    parser.add_argument("--seed", type=int)
+    return parser
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    """Run the server until cancelled."""
+    server = MockTsunServer(
+        stations=args.stations,
+        latency=args.latency / 1000,
+        jitter=args.jitter / 1000,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        fail_endpoints=args.fail,
+        html_endpoints=args.html,
+        regions=args.regions,
+        seed=args.seed,
+    )
+    url = await server.start(args.host, args.port)
+    print(f"Mock TSUN API listening on {url}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(_serve(build_parser().parse_args()))
+    except KeyboardInterrupt:
+        pass